@@ -5,10 +5,15 @@ cd /app/api_gateway
 sh bin/run.sh root/conf.yaml &
 
 # Wait for the API Gateway to become healthy before starting the tickler
+# Poll with a short backoff (0.2s -> 2s cap) instead of a fixed 2s sleep
 echo "Waiting for API Gateway to become healthy..."
+delays=(0.2 0.3 0.5 0.8 1.2)
+attempt=0
 while ! /usr/local/bin/healthcheck.sh > /dev/null 2>&1; do
-  echo "API Gateway not ready yet, waiting..."
-  sleep 2
+  delay=${delays[$attempt]:-2}
+  echo "API Gateway not ready yet, retrying in ${delay}s..."
+  sleep "$delay"
+  attempt=$((attempt + 1))
 done
 
 echo "API Gateway is healthy, starting tickler..."
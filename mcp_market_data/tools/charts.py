@@ -221,13 +221,14 @@ async def chart_price(
     format: str = Query("png", description="Output: png (image) or base64 (JSON with encoded image)"),
 ):
     """Generate a candlestick chart with volume and moving averages. Returns PNG image or base64 JSON."""
+    ticker = ticker.upper()
     try:
-        buf = await asyncio.to_thread(_generate_candlestick, ticker.upper(), period, interval)
-        return _chart_response(buf, format, f"chart_{ticker.upper()}_{period}.png")
+        buf = await asyncio.to_thread(_generate_candlestick, ticker, period, interval)
+        return _chart_response(buf, format, f"chart_{ticker}_{period}.png")
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Chart error for {ticker}: {e}")
+        logger.error("Chart error for %s: %s", ticker, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -247,7 +248,7 @@ async def chart_comparison(
         buf = await asyncio.to_thread(_generate_comparison, ticker_list, period)
         return _chart_response(buf, format, f"comparison_{period}.png")
     except Exception as e:
-        logger.error(f"Comparison chart error: {e}")
+        logger.error("Comparison chart error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -261,5 +262,5 @@ async def chart_fear_greed(
         buf = await asyncio.to_thread(_generate_fear_greed_gauge, score)
         return _chart_response(buf, format, f"feargreed_{int(score)}.png")
     except Exception as e:
-        logger.error(f"Fear & Greed chart error: {e}")
+        logger.error("Fear & Greed chart error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query
 
 from mcp_market_data.tools._ticker_pool import get_ticker
@@ -16,14 +17,14 @@ CACHE_TTL = 300  # 5 min
 def _get_cached(key: str) -> dict | None:
     if key in _cache:
         entry = _cache[key]
-        if datetime.now() < entry["expires_at"]:
+        if time.monotonic() < entry["expires_at"]:
             return entry["data"]
         del _cache[key]
     return None
 
 
 def _set_cache(key: str, data: dict) -> None:
-    _cache[key] = {"data": data, "expires_at": datetime.now() + timedelta(seconds=CACHE_TTL)}
+    _cache[key] = {"data": data, "expires_at": time.monotonic() + CACHE_TTL}
 
 
 def _safe_df_to_records(df, limit: int = 10) -> list | None:
@@ -35,6 +36,9 @@ def _safe_df_to_records(df, limit: int = 10) -> list | None:
         # Convert Timestamps to strings
         for rec in records:
             for k, v in rec.items():
+                # Plain Python scalars are already JSON-ready; skip the attribute probes
+                if v is None or isinstance(v, (str, int, float, bool)):
+                    continue
                 if hasattr(v, 'isoformat'):
                     rec[k] = v.isoformat()
                 elif hasattr(v, 'item'):
@@ -47,13 +51,14 @@ def _safe_df_to_records(df, limit: int = 10) -> list | None:
 @router.get("/earnings/{ticker}")
 async def get_earnings(ticker: str):
     """Get earnings history, upcoming dates, and earnings surprises."""
-    cache_key = f"earnings:{ticker.upper()}"
+    ticker = ticker.upper()
+    cache_key = f"earnings:{ticker}"
     cached = _get_cached(cache_key)
     if cached:
         return cached
 
     try:
-        t = get_ticker(ticker.upper())
+        t = get_ticker(ticker)
 
         earnings_history = await asyncio.to_thread(lambda: _safe_df_to_records(t.earnings_history, 12))
         earnings_dates = await asyncio.to_thread(lambda: _safe_df_to_records(t.earnings_dates, 4))
@@ -62,7 +67,7 @@ async def get_earnings(ticker: str):
         info = await asyncio.to_thread(lambda: t.info)
 
         result = {
-            "ticker": ticker.upper(),
+            "ticker": ticker,
             "eps_trailing": info.get("trailingEps"),
             "eps_forward": info.get("forwardEps"),
             "earnings_growth": info.get("earningsGrowth"),
@@ -75,27 +80,28 @@ async def get_earnings(ticker: str):
         _set_cache(cache_key, result)
         return result
     except Exception as e:
-        logger.error(f"Earnings error for {ticker}: {e}")
+        logger.error("Earnings error for %s: %s", ticker, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/financials/{ticker}")
 async def get_financials(ticker: str):
     """Get income statement, balance sheet, and cash flow (quarterly)."""
-    cache_key = f"financials:{ticker.upper()}"
+    ticker = ticker.upper()
+    cache_key = f"financials:{ticker}"
     cached = _get_cached(cache_key)
     if cached:
         return cached
 
     try:
-        t = get_ticker(ticker.upper())
+        t = get_ticker(ticker)
 
         income = await asyncio.to_thread(lambda: _safe_df_to_records(t.quarterly_income_stmt.T, 4))
         balance = await asyncio.to_thread(lambda: _safe_df_to_records(t.quarterly_balance_sheet.T, 4))
         cashflow = await asyncio.to_thread(lambda: _safe_df_to_records(t.quarterly_cashflow.T, 4))
 
         result = {
-            "ticker": ticker.upper(),
+            "ticker": ticker,
             "income_statement": income,
             "balance_sheet": balance,
             "cash_flow": cashflow,
@@ -103,20 +109,21 @@ async def get_financials(ticker: str):
         _set_cache(cache_key, result)
         return result
     except Exception as e:
-        logger.error(f"Financials error for {ticker}: {e}")
+        logger.error("Financials error for %s: %s", ticker, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/holders/{ticker}")
 async def get_holders(ticker: str):
     """Get institutional holders, mutual fund holders, and ownership breakdown."""
-    cache_key = f"holders:{ticker.upper()}"
+    ticker = ticker.upper()
+    cache_key = f"holders:{ticker}"
     cached = _get_cached(cache_key)
     if cached:
         return cached
 
     try:
-        t = get_ticker(ticker.upper())
+        t = get_ticker(ticker)
 
         institutional = await asyncio.to_thread(lambda: _safe_df_to_records(t.institutional_holders, 15))
         mutual_funds = await asyncio.to_thread(lambda: _safe_df_to_records(t.mutualfund_holders, 15))
@@ -124,7 +131,7 @@ async def get_holders(ticker: str):
         info = await asyncio.to_thread(lambda: t.info)
 
         result = {
-            "ticker": ticker.upper(),
+            "ticker": ticker,
             "held_by_insiders": info.get("heldPercentInsiders"),
             "held_by_institutions": info.get("heldPercentInstitutions"),
             "float_shares": info.get("floatShares"),
@@ -138,7 +145,7 @@ async def get_holders(ticker: str):
         _set_cache(cache_key, result)
         return result
     except Exception as e:
-        logger.error(f"Holders error for {ticker}: {e}")
+        logger.error("Holders error for %s: %s", ticker, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
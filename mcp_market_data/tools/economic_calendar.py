@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+import time
 from datetime import datetime, timedelta
 
 import finnhub
@@ -35,14 +36,14 @@ CACHE_TTL_EARNINGS = 14400  # 4h for earnings/IPO
 def _get_cached(key: str) -> dict | None:
     if key in _cache:
         entry = _cache[key]
-        if datetime.now() < entry["expires_at"]:
+        if time.monotonic() < entry["expires_at"]:
             return entry["data"]
         del _cache[key]
     return None
 
 
 def _set_cache(key: str, data: dict, ttl: int = CACHE_TTL_CALENDAR) -> None:
-    _cache[key] = {"data": data, "expires_at": datetime.now() + timedelta(seconds=ttl)}
+    _cache[key] = {"data": data, "expires_at": time.monotonic() + ttl}
 
 
 # --------------- Sync data fetchers ---------------
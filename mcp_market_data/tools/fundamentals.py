@@ -1,5 +1,5 @@
 import asyncio
-from datetime import datetime, timedelta
+import time
 from fastapi import APIRouter, HTTPException
 
 from mcp_market_data.tools._ticker_pool import get_ticker
@@ -14,14 +14,14 @@ FUNDAMENTALS_CACHE_TTL = 60
 def _get_cached(key: str) -> dict | None:
     if key in _fundamentals_cache:
         entry = _fundamentals_cache[key]
-        if datetime.now() < entry["expires_at"]:
+        if time.monotonic() < entry["expires_at"]:
             return entry["data"]
         del _fundamentals_cache[key]
     return None
 
 
 def _set_cache(key: str, data: dict) -> None:
-    _fundamentals_cache[key] = {"data": data, "expires_at": datetime.now() + timedelta(seconds=FUNDAMENTALS_CACHE_TTL)}
+    _fundamentals_cache[key] = {"data": data, "expires_at": time.monotonic() + FUNDAMENTALS_CACHE_TTL}
 
 
 def _fetch_ticker_info(ticker: str) -> dict:
@@ -32,17 +32,18 @@ def _fetch_ticker_info(ticker: str) -> dict:
 @router.get("/fundamentals/{ticker}")
 async def get_fundamentals(ticker: str):
     """Get fundamental data: P/E, market cap, revenue, EPS, dividend yield, sector."""
-    cache_key = f"fundamentals:{ticker.upper()}"
+    ticker = ticker.upper()
+    cache_key = f"fundamentals:{ticker}"
     cached = _get_cached(cache_key)
     if cached:
         return cached
 
     try:
-        info = await asyncio.to_thread(_fetch_ticker_info, ticker.upper())
+        info = await asyncio.to_thread(_fetch_ticker_info, ticker)
         if not info or "shortName" not in info:
             raise HTTPException(status_code=404, detail=f"No data found for {ticker}")
         result = {
-            "ticker": ticker.upper(),
+            "ticker": ticker,
             "name": info.get("shortName"),
             "sector": info.get("sector"),
             "industry": info.get("industry"),
@@ -79,11 +80,12 @@ async def get_fundamentals(ticker: str):
 @router.get("/analyst/{ticker}")
 async def get_analyst_recommendations(ticker: str):
     """Get analyst consensus: buy/hold/sell counts and price targets."""
+    ticker = ticker.upper()
     try:
-        info = await asyncio.to_thread(_fetch_ticker_info, ticker.upper())
+        info = await asyncio.to_thread(_fetch_ticker_info, ticker)
         recommendations = None
         try:
-            t = get_ticker(ticker.upper())
+            t = get_ticker(ticker)
             recs = await asyncio.to_thread(lambda: t.recommendations)
             if recs is not None and not recs.empty:
                 recent = recs.tail(10)
@@ -92,7 +94,7 @@ async def get_analyst_recommendations(ticker: str):
             pass
 
         return {
-            "ticker": ticker.upper(),
+            "ticker": ticker,
             "recommendation_key": info.get("recommendationKey"),
             "recommendation_mean": info.get("recommendationMean"),
             "number_of_analysts": info.get("numberOfAnalystOpinions"),
@@ -110,10 +112,11 @@ async def get_analyst_recommendations(ticker: str):
 @router.get("/insiders/{ticker}")
 async def get_insider_trades(ticker: str):
     """Get recent insider transactions for a ticker."""
+    ticker = ticker.upper()
     try:
         insider_transactions = None
         try:
-            t = get_ticker(ticker.upper())
+            t = get_ticker(ticker)
             txns = await asyncio.to_thread(lambda: t.insider_transactions)
             if txns is not None and not txns.empty:
                 recent = txns.head(20)
@@ -130,7 +133,7 @@ async def get_insider_trades(ticker: str):
             pass
 
         return {
-            "ticker": ticker.upper(),
+            "ticker": ticker,
             "insider_transactions": insider_transactions,
             "insider_holders": insider_holders,
         }
@@ -18,8 +18,9 @@ async def get_history(
     interval: str = Query("1d", description="Interval: 1m,2m,5m,15m,30m,60m,90m,1h,1d,5d,1wk,1mo,3mo"),
 ):
     """Get OHLCV historical data for a ticker with configurable period and interval."""
+    ticker = ticker.upper()
     try:
-        hist = await asyncio.to_thread(_fetch_history, ticker.upper(), period, interval)
+        hist = await asyncio.to_thread(_fetch_history, ticker, period, interval)
 
         if hist.empty:
             raise HTTPException(status_code=404, detail=f"No history for {ticker}")
@@ -36,7 +37,7 @@ async def get_history(
             })
 
         return {
-            "ticker": ticker.upper(),
+            "ticker": ticker,
             "period": period,
             "interval": interval,
             "data_points": len(records),
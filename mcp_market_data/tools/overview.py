@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from fastapi import APIRouter
 
 from mcp_market_data.tools._ticker_pool import get_ticker
@@ -56,10 +57,10 @@ async def _fetch_ticker_info(symbol: str, name: str, is_index: bool = False) ->
             result["change"] = info.get("regularMarketChange")
         return result
     except asyncio.TimeoutError:
-        logger.warning(f"Timeout fetching {symbol}")
+        logger.warning("Timeout fetching %s", symbol)
         return {"symbol": symbol, "name": name, "error": "Timeout"}
     except Exception as e:
-        logger.warning(f"Error fetching {symbol}: {e}")
+        logger.warning("Error fetching %s: %s", symbol, e)
         return {"symbol": symbol, "name": name, "error": "Failed to fetch"}
 
 
@@ -70,10 +71,8 @@ async def get_market_overview():
     Results are cached for 60 seconds to improve performance.
     All tickers are fetched in parallel.
     """
-    now = datetime.now()
-
     # Return cached data if valid
-    if _cache["data"] is not None and _cache["expires_at"] and now < _cache["expires_at"]:
+    if _cache["data"] is not None and _cache["expires_at"] and time.monotonic() < _cache["expires_at"]:
         logger.debug("Returning cached market overview")
         return _cache["data"]
 
@@ -95,11 +94,11 @@ async def get_market_overview():
     result = {
         "indices": indices,
         "sectors": sectors,
-        "cached_at": now.isoformat(),
+        "cached_at": datetime.now().isoformat(),
     }
 
     # Update cache
     _cache["data"] = result
-    _cache["expires_at"] = now + timedelta(seconds=CACHE_TTL_SECONDS)
+    _cache["expires_at"] = time.monotonic() + CACHE_TTL_SECONDS
 
     return result
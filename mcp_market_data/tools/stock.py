@@ -1,5 +1,5 @@
 import asyncio
-from datetime import datetime, timedelta
+import time
 from fastapi import APIRouter, HTTPException, Query
 
 from mcp_market_data.tools._ticker_pool import get_ticker
@@ -14,14 +14,14 @@ PRICE_CACHE_TTL = 60
 def _get_cached(cache: dict, key: str) -> dict | None:
     if key in cache:
         entry = cache[key]
-        if datetime.now() < entry["expires_at"]:
+        if time.monotonic() < entry["expires_at"]:
             return entry["data"]
         del cache[key]
     return None
 
 
 def _set_cache(cache: dict, key: str, data: dict, ttl: int) -> None:
-    cache[key] = {"data": data, "expires_at": datetime.now() + timedelta(seconds=ttl)}
+    cache[key] = {"data": data, "expires_at": time.monotonic() + ttl}
 
 
 def _fetch_ticker_info(ticker: str) -> dict:
@@ -32,13 +32,14 @@ def _fetch_ticker_info(ticker: str) -> dict:
 @router.get("/price/{ticker}")
 async def get_stock_price(ticker: str):
     """Get current stock price, change, volume, and day range for a ticker."""
-    cache_key = f"price:{ticker.upper()}"
+    ticker = ticker.upper()
+    cache_key = f"price:{ticker}"
     cached = _get_cached(_price_cache, cache_key)
     if cached:
         return cached
 
     try:
-        info = await asyncio.to_thread(_fetch_ticker_info, ticker.upper())
+        info = await asyncio.to_thread(_fetch_ticker_info, ticker)
         if not info:
             raise HTTPException(status_code=404, detail=f"No data found for {ticker}")
 
@@ -55,7 +56,7 @@ async def get_stock_price(ticker: str):
             change_pct = round((change / prev_close) * 100, 2)
 
         result = {
-            "ticker": ticker.upper(),
+            "ticker": ticker,
             "price": price,
             "previous_close": prev_close,
             "change": change,
@@ -156,9 +156,10 @@ async def chart_technicals(
     format: str = Query("png", description="Output: png (image) or base64 (JSON with encoded image)"),
 ):
     """Generate a technical analysis chart with candlestick, Bollinger Bands, RSI, and MACD panels. Returns PNG image or base64 JSON."""
+    ticker = ticker.upper()
     try:
-        buf = await asyncio.to_thread(_generate_technical_chart, ticker.upper(), period)
-        return _chart_response(buf, format, f"technicals_{ticker.upper()}_{period}.png")
+        buf = await asyncio.to_thread(_generate_technical_chart, ticker, period)
+        return _chart_response(buf, format, f"technicals_{ticker}_{period}.png")
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -1,7 +1,7 @@
 """Technical indicators computed from yfinance OHLCV data (pandas/numpy only)."""
 
 import asyncio
-from datetime import datetime, timedelta
+import time
 
 import numpy as np
 import pandas as pd
@@ -18,14 +18,14 @@ CACHE_TTL = 300  # 5 min
 def _get_cached(key: str) -> dict | None:
     if key in _cache:
         entry = _cache[key]
-        if datetime.now() < entry["expires_at"]:
+        if time.monotonic() < entry["expires_at"]:
             return entry["data"]
         del _cache[key]
     return None
 
 
 def _set_cache(key: str, data: dict) -> None:
-    _cache[key] = {"data": data, "expires_at": datetime.now() + timedelta(seconds=CACHE_TTL)}
+    _cache[key] = {"data": data, "expires_at": time.monotonic() + CACHE_TTL}
 
 
 # --------------- Indicator calculations ---------------
@@ -0,0 +1,17 @@
+"""Keyword matching shared by the keyword-based sentiment tools.
+
+Each keyword set is compiled into one case-insensitive alternation, longest
+keywords first, so a text is scanned once per set rather than once per word.
+"""
+
+import re
+
+
+def keyword_regex(words: set[str]) -> re.Pattern:
+    """Case-insensitive alternation, longest keywords first."""
+    return re.compile("|".join(re.escape(w) for w in sorted(words, key=len, reverse=True)), re.IGNORECASE)
+
+
+def count_keywords(regex: re.Pattern, text: str) -> int:
+    """Number of distinct keywords found in text (single scan)."""
+    return len({m.lower() for m in regex.findall(text)})
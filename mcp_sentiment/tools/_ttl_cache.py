@@ -0,0 +1,41 @@
+"""Insertion-ordered TTL cache shared by the sentiment tools.
+
+Entries are kept in write order, so with a single TTL per cache the oldest
+entry is always at the head: expired entries are swept from the front on
+each write and the sweep stops at the first live one (O(expired), not O(n)).
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """key → (value, timestamp) with a fixed TTL in seconds."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+
+    def get(self, key: Hashable, now: float) -> Any | None:
+        """Return the cached value if still fresh, else None."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, ts = entry
+        if now - ts < self.ttl:
+            return value
+        del self._data[key]
+        return None
+
+    def set(self, key: Hashable, value: Any, now: float) -> None:
+        """Store value at the tail and drop expired entries from the head."""
+        self._data[key] = (value, now)
+        self._data.move_to_end(key)
+        while self._data:
+            _, (_, ts) = next(iter(self._data.items()))
+            if now - ts < self.ttl:
+                break
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,7 +1,8 @@
 import os
 import logging
 import httpx
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import datetime, timezone
 from fastapi import APIRouter, HTTPException
 
 logger = logging.getLogger(__name__)
@@ -29,7 +30,7 @@ _daily_counter = {"date": None, "count": 0}
 def _get_cached(key: str) -> dict | None:
     if key in _cache:
         entry = _cache[key]
-        if datetime.now() < entry["expires_at"]:
+        if time.monotonic() < entry["expires_at"]:
             return entry["data"]
         del _cache[key]
     return None
@@ -38,7 +39,7 @@ def _get_cached(key: str) -> dict | None:
 def _set_cache(key: str, data: dict) -> None:
     _cache[key] = {
         "data": data,
-        "expires_at": datetime.now() + timedelta(seconds=CACHE_TTL_SECONDS),
+        "expires_at": time.monotonic() + CACHE_TTL_SECONDS,
     }
 
 
@@ -59,11 +60,12 @@ def _check_daily_limit() -> int:
 @router.get("/alphavantage/{ticker}")
 async def get_alphavantage_sentiment(ticker: str):
     """Get Alpha Vantage news sentiment for a ticker. Free tier: 25 req/day, cached 1h."""
+    ticker = ticker.upper()
     api_key = os.environ.get("ALPHAVANTAGE_API_KEY")
     if not api_key or api_key.startswith("<"):
         raise HTTPException(status_code=503, detail="Alpha Vantage not configured. Set ALPHAVANTAGE_API_KEY.")
 
-    cache_key = f"alphavantage_sentiment:{ticker.upper()}"
+    cache_key = f"alphavantage_sentiment:{ticker}"
     cached = _get_cached(cache_key)
     if cached:
         return cached
@@ -80,7 +82,7 @@ async def get_alphavantage_sentiment(ticker: str):
             AV_BASE,
             params={
                 "function": "NEWS_SENTIMENT",
-                "tickers": ticker.upper(),
+                "tickers": ticker,
                 "apikey": api_key,
             },
         )
@@ -95,22 +97,21 @@ async def get_alphavantage_sentiment(ticker: str):
 
         feed = data.get("feed", [])
         if not feed:
-            raise HTTPException(status_code=404, detail=f"No sentiment data for {ticker.upper()}")
+            raise HTTPException(status_code=404, detail=f"No sentiment data for {ticker}")
 
-        ticker_upper = ticker.upper()
         scores = []
         labels = []
 
         for article in feed:
             for ts in article.get("ticker_sentiment", []):
-                if ts.get("ticker") == ticker_upper:
+                if ts.get("ticker") == ticker:
                     score = float(ts.get("ticker_sentiment_score", 0))
                     scores.append(score)
                     labels.append(ts.get("ticker_sentiment_label", "Neutral"))
                     break
 
         if not scores:
-            raise HTTPException(status_code=404, detail=f"No ticker-specific sentiment for {ticker_upper}")
+            raise HTTPException(status_code=404, detail=f"No ticker-specific sentiment for {ticker}")
 
         avg_raw = sum(scores) / len(scores)
         # Alpha Vantage scores are already in -1..1 range (approximately -0.35 to 0.35 typical)
@@ -125,7 +126,7 @@ async def get_alphavantage_sentiment(ticker: str):
             unified_label = "neutral"
 
         result = {
-            "ticker": ticker_upper,
+            "ticker": ticker,
             "source": "alphavantage",
             "sentiment_score": sentiment_score,
             "sentiment_label": unified_label,
@@ -138,5 +139,5 @@ async def get_alphavantage_sentiment(ticker: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Alpha Vantage error for {ticker}: {e}")
+        logger.error("Alpha Vantage error for %s: %s", ticker, e)
         raise HTTPException(status_code=500, detail=str(e))
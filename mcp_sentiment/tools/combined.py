@@ -5,6 +5,8 @@ from fastapi import APIRouter, HTTPException
 
 router = APIRouter(prefix="/sentiment", tags=["Combined Sentiment"])
 
+SENTIMENT_BASE_URL = os.environ.get("MCP_SENTIMENT_INTERNAL_URL", "http://mcp_sentiment:5004")
+
 # Shared httpx client (connection pooling)
 _client = httpx.AsyncClient(timeout=30.0)
 
@@ -30,7 +32,7 @@ FEAR_GREED_BLEND = 0.20  # 20% macro blend
 @router.get("/combined/{ticker}")
 async def get_combined_sentiment(ticker: str):
     """Aggregate sentiment from 5 sources (Finnhub, Alpha Vantage, Reddit, StockTwits, Fear&Greed) into a unified score."""
-    base_url = os.environ.get("MCP_SENTIMENT_INTERNAL_URL", "http://mcp_sentiment:5004")
+    base_url = SENTIMENT_BASE_URL
 
     async def _fetch(source: str, url: str) -> tuple[str, dict]:
         try:
@@ -2,29 +2,31 @@
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
 
 from fastapi import APIRouter
 
+from mcp_sentiment.tools._ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/sentiment", tags=["Earnings Proximity"])
 
 # Cache: ticker → (result, timestamp)
-_cache: dict[str, tuple[dict, float]] = {}
 CACHE_TTL = 3600  # 1h — earnings dates are fixed, rarely change intraday
+_cache = TTLCache(CACHE_TTL)
 
 
 @router.get("/earnings/{ticker}")
 async def get_earnings_proximity(ticker: str):
     """Check if earnings are coming soon for a ticker."""
     ticker = ticker.upper()
-    now = datetime.now(timezone.utc).timestamp()
+    now = time.monotonic()
 
-    if ticker in _cache:
-        cached, ts = _cache[ticker]
-        if now - ts < CACHE_TTL:
-            return cached
+    cached = _cache.get(ticker, now)
+    if cached is not None:
+        return cached
 
     try:
         import yfinance as yf
@@ -83,5 +85,5 @@ async def get_earnings_proximity(ticker: str):
         "earnings_imminent": earnings_imminent,
         "confidence_modifier": 0.7 if earnings_imminent else 1.0,
     }
-    _cache[ticker] = (result, now)
+    _cache.set(ticker, result, now)
     return result
@@ -1,7 +1,7 @@
 import time
 import logging
 import httpx
-from datetime import datetime, timedelta
+from datetime import datetime
 from fastapi import APIRouter, HTTPException
 
 logger = logging.getLogger(__name__)
@@ -28,7 +28,7 @@ _circuit = {"open": False, "last_check": 0.0, "cooldown": 600}
 def _get_cached(key: str) -> dict | None:
     if key in _cache:
         entry = _cache[key]
-        if datetime.now() < entry["expires_at"]:
+        if time.monotonic() < entry["expires_at"]:
             return entry["data"]
         del _cache[key]
     return None
@@ -37,7 +37,7 @@ def _get_cached(key: str) -> dict | None:
 def _set_cache(key: str, data: dict) -> None:
     _cache[key] = {
         "data": data,
-        "expires_at": datetime.now() + timedelta(seconds=CACHE_TTL_SECONDS),
+        "expires_at": time.monotonic() + CACHE_TTL_SECONDS,
     }
 
 
@@ -106,5 +106,5 @@ async def get_fear_greed():
     except Exception as e:
         _circuit["open"] = True
         _circuit["last_check"] = time.time()
-        logger.error(f"Fear & Greed error: {e}")
+        logger.error("Fear & Greed error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,8 +1,8 @@
 import asyncio
 import os
 import logging
+import time
 import finnhub
-from datetime import datetime, timedelta
 from fastapi import APIRouter, HTTPException
 
 logger = logging.getLogger(__name__)
@@ -19,7 +19,7 @@ _finnhub_client = None
 def _get_cached(key: str) -> dict | None:
     if key in _cache:
         entry = _cache[key]
-        if datetime.now() < entry["expires_at"]:
+        if time.monotonic() < entry["expires_at"]:
             return entry["data"]
         del _cache[key]
     return None
@@ -28,7 +28,7 @@ def _get_cached(key: str) -> dict | None:
 def _set_cache(key: str, data: dict) -> None:
     _cache[key] = {
         "data": data,
-        "expires_at": datetime.now() + timedelta(seconds=CACHE_TTL_SECONDS),
+        "expires_at": time.monotonic() + CACHE_TTL_SECONDS,
     }
 
 
@@ -45,7 +45,8 @@ def _get_finnhub_client():
 @router.get("/finnhub/{ticker}")
 async def get_finnhub_sentiment(ticker: str):
     """Get Finnhub news sentiment for a ticker: NLP-based bullish/bearish scores from press articles."""
-    cache_key = f"finnhub_sentiment:{ticker.upper()}"
+    ticker = ticker.upper()
+    cache_key = f"finnhub_sentiment:{ticker}"
     cached = _get_cached(cache_key)
     if cached:
         return cached
@@ -55,10 +56,10 @@ async def get_finnhub_sentiment(ticker: str):
         raise HTTPException(status_code=503, detail="Finnhub API not configured. Set FINNHUB_API_KEY.")
 
     try:
-        data = await asyncio.to_thread(client.news_sentiment, ticker.upper())
+        data = await asyncio.to_thread(client.news_sentiment, ticker)
 
         if not data or not data.get("sentiment"):
-            raise HTTPException(status_code=404, detail=f"No sentiment data for {ticker.upper()}")
+            raise HTTPException(status_code=404, detail=f"No sentiment data for {ticker}")
 
         sentiment = data["sentiment"]
         buzz = data.get("buzz", {})
@@ -68,7 +69,7 @@ async def get_finnhub_sentiment(ticker: str):
         sentiment_score = round(bullish_pct - bearish_pct, 4)
 
         result = {
-            "ticker": ticker.upper(),
+            "ticker": ticker,
             "source": "finnhub",
             "sentiment_score": sentiment_score,
             "company_news_score": sentiment.get("companyNewsScore", 0),
@@ -89,8 +90,8 @@ async def get_finnhub_sentiment(ticker: str):
     except finnhub.FinnhubAPIException as e:
         status = 503 if "403" in str(e) else 502
         detail = "Finnhub news_sentiment requires a premium plan" if "403" in str(e) else str(e)
-        logger.warning(f"Finnhub API error for {ticker}: {e}")
+        logger.warning("Finnhub API error for %s: %s", ticker, e)
         raise HTTPException(status_code=status, detail=detail)
     except Exception as e:
-        logger.error(f"Finnhub sentiment error for {ticker}: {e}")
+        logger.error("Finnhub sentiment error for %s: %s", ticker, e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -2,17 +2,19 @@
 
 import asyncio
 import logging
-from datetime import datetime
+import time
 
 from fastapi import APIRouter
 
+from mcp_sentiment.tools._ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/sentiment", tags=["Google Trends"])
 
 # Cache: ticker → (result, timestamp)
-_cache: dict[str, tuple[dict, float]] = {}
 CACHE_TTL = 1800  # 30 min — trends are weekly data, no need to refresh faster
+_cache = TTLCache(CACHE_TTL)
 
 # Map tickers to search terms (company names work better than symbols)
 TICKER_SEARCH_TERMS = {
@@ -32,12 +34,11 @@ TICKER_SEARCH_TERMS = {
 async def get_google_trends(ticker: str):
     """Get Google Trends interest for a ticker over the last 7 days."""
     ticker = ticker.upper()
-    now = datetime.utcnow().timestamp()
+    now = time.monotonic()
 
-    if ticker in _cache:
-        cached, ts = _cache[ticker]
-        if now - ts < CACHE_TTL:
-            return cached
+    cached = _cache.get(ticker, now)
+    if cached is not None:
+        return cached
 
     search_term = TICKER_SEARCH_TERMS.get(ticker, f"{ticker} stock")
 
@@ -54,7 +55,7 @@ async def get_google_trends(ticker: str):
             "search_term": search_term,
             "error": str(e),
         }
-        _cache[ticker] = (result, now)
+        _cache.set(ticker, result, now)
         return result
 
     if df is None or df.empty or search_term not in df.columns:
@@ -66,7 +67,7 @@ async def get_google_trends(ticker: str):
             "interest_avg": None,
             "spike": False,
         }
-        _cache[ticker] = (result, now)
+        _cache.set(ticker, result, now)
         return result
 
     values = df[search_term].values
@@ -93,5 +94,5 @@ async def get_google_trends(ticker: str):
         "spike": spike,
         "spike_ratio": round(spike_ratio, 2),
     }
-    _cache[ticker] = (result, now)
+    _cache.set(ticker, result, now)
     return result
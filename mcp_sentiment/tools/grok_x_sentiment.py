@@ -12,10 +12,13 @@ import asyncio
 import json
 import logging
 import os
-from datetime import datetime
+import re
+import time
 
 from fastapi import APIRouter, Body
 
+from mcp_sentiment.tools._ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/sentiment", tags=["Grok X Sentiment"])
@@ -25,11 +28,17 @@ GROK_BASE_URL = "https://api.x.ai/v1"
 GROK_MODEL = "grok-3-mini"
 
 # Cache: ticker → (result, timestamp)
-_cache: dict[str, tuple[dict, float]] = {}
 CACHE_TTL = 3600  # 1 hour
+_cache = TTLCache(CACHE_TTL)
 
 _EU_SUFFIXES = (".PA", ".DE", ".AS", ".SW", ".L")
 
+# Created on first call, see _get_grok_client()
+_grok_client = None
+
+# Markdown code fence around a JSON reply: captures the body, closing fence optional
+_CODE_FENCE_RE = re.compile(r"```[^\n]*\n(.*?)(?:```)?\s*\Z", re.DOTALL)
+
 SYSTEM_PROMPT_CONTEXTUAL = (
     "Tu es un analyste sentiment contrarian specialise dans les reseaux sociaux financiers. "
     "Tu recois un briefing complet d'un autre analyste (donnees techniques, fondamentales, macro, sentiment multi-sources). "
@@ -85,20 +94,25 @@ def _build_briefing_prompt(ticker: str, briefing: dict) -> str:
 def _parse_grok_response(raw: str) -> dict:
     """Parse Grok JSON response, handling markdown code blocks."""
     text = raw.strip()
-    if text.startswith("```"):
-        text = text.split("\n", 1)[-1]
-        if text.endswith("```"):
-            text = text[:-3]
-        text = text.strip()
+    fenced = _CODE_FENCE_RE.match(text)
+    if fenced:
+        text = fenced.group(1).strip()
     return json.loads(text)
 
 
+def _get_grok_client():
+    """Shared AsyncOpenAI client (keeps its connection pool across calls)."""
+    global _grok_client
+    if _grok_client is None:
+        from openai import AsyncOpenAI
+        _grok_client = AsyncOpenAI(base_url=GROK_BASE_URL, api_key=GROK_API_KEY)
+    return _grok_client
+
+
 async def _call_grok(messages: list[dict]) -> str:
     """Call Grok API and return raw response text."""
-    from openai import AsyncOpenAI
-    client = AsyncOpenAI(base_url=GROK_BASE_URL, api_key=GROK_API_KEY)
     response = await asyncio.wait_for(
-        client.chat.completions.create(model=GROK_MODEL, messages=messages),
+        _get_grok_client().chat.completions.create(model=GROK_MODEL, messages=messages),
         timeout=30.0,
     )
     return response.choices[0].message.content.strip()
@@ -109,18 +123,17 @@ async def get_grok_x_contextual(ticker: str, briefing: dict = Body(...)):
     """Contextual Grok X analysis — confronts our full briefing with X/Twitter sentiment."""
     ticker = ticker.upper()
 
-    if any(ticker.endswith(s) for s in _EU_SUFFIXES):
+    if ticker.endswith(_EU_SUFFIXES):
         return {"ticker": ticker, "skipped": "not_us_ticker", "sentiment_score": None}
 
     if not GROK_API_KEY:
         return {"ticker": ticker, "skipped": "no_api_key", "sentiment_score": None}
 
-    now = datetime.utcnow().timestamp()
+    now = time.monotonic()
     cache_key = f"ctx_{ticker}"
-    if cache_key in _cache:
-        cached, ts = _cache[cache_key]
-        if now - ts < CACHE_TTL:
-            return cached
+    cached = _cache.get(cache_key, now)
+    if cached is not None:
+        return cached
 
     try:
         raw = await _call_grok([
@@ -144,7 +157,7 @@ async def get_grok_x_contextual(ticker: str, briefing: dict = Body(...)):
             "contrarian_signal": data.get("contrarian_signal", False),
             "model": GROK_MODEL,
         }
-        _cache[cache_key] = (result, now)
+        _cache.set(cache_key, result, now)
         return result
 
     except json.JSONDecodeError:
@@ -163,17 +176,16 @@ async def get_grok_x_sentiment(ticker: str):
     """Legacy simple Grok X search (no briefing context)."""
     ticker = ticker.upper()
 
-    if any(ticker.endswith(s) for s in _EU_SUFFIXES):
+    if ticker.endswith(_EU_SUFFIXES):
         return {"ticker": ticker, "skipped": "not_us_ticker", "sentiment_score": None}
 
     if not GROK_API_KEY:
         return {"ticker": ticker, "skipped": "no_api_key", "sentiment_score": None}
 
-    now = datetime.utcnow().timestamp()
-    if ticker in _cache:
-        cached, ts = _cache[ticker]
-        if now - ts < CACHE_TTL:
-            return cached
+    now = time.monotonic()
+    cached = _cache.get(ticker, now)
+    if cached is not None:
+        return cached
 
     try:
         raw = await _call_grok([
@@ -199,7 +211,7 @@ async def get_grok_x_sentiment(ticker: str):
             "contrarian_signal": data.get("contrarian_signal", False),
             "model": GROK_MODEL,
         }
-        _cache[ticker] = (result, now)
+        _cache.set(ticker, result, now)
         return result
 
     except json.JSONDecodeError:
@@ -3,30 +3,32 @@
 import asyncio
 import logging
 import os
+import time
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter
 
+from mcp_sentiment.tools._ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/sentiment", tags=["Insider Signal"])
 
 MARKET_DATA_URL = os.environ.get("MCP_MARKET_DATA_URL", "http://mcp_market_data:5003")
 
-_cache: dict[str, tuple[dict, float]] = {}
 CACHE_TTL = 86400  # 24h — Form 4 filings update daily
+_cache = TTLCache(CACHE_TTL)
 
 
 @router.get("/insider/{ticker}")
 async def get_insider_signal(ticker: str):
     """Analyze recent insider transactions for buy/sell signal."""
     ticker = ticker.upper()
-    now = datetime.utcnow().timestamp()
+    now = time.monotonic()
 
-    if ticker in _cache:
-        cached, ts = _cache[ticker]
-        if now - ts < CACHE_TTL:
-            return cached
+    cached = _cache.get(ticker, now)
+    if cached is not None:
+        return cached
 
     try:
         import yfinance as yf
@@ -39,7 +41,7 @@ async def get_insider_signal(ticker: str):
     if txns is None or (hasattr(txns, "empty") and txns.empty):
         result = {"ticker": ticker, "sentiment_score": None, "net_purchases": 0,
                   "buys": 0, "sells": 0, "label": "no_data", "transactions": []}
-        _cache[ticker] = (result, now)
+        _cache.set(ticker, result, now)
         return result
 
     # Filter last 90 days
@@ -114,5 +116,5 @@ async def get_insider_signal(ticker: str):
         "period": "90d",
         "transactions": recent[:10],
     }
-    _cache[ticker] = (result, now)
+    _cache.set(ticker, result, now)
     return result
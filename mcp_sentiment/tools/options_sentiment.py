@@ -2,35 +2,42 @@
 
 import asyncio
 import logging
-from datetime import datetime
+import time
 
 from fastapi import APIRouter
 
+from mcp_sentiment.tools._ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/sentiment", tags=["Options Sentiment"])
 
-_cache: dict[str, tuple[dict, float]] = {}
 CACHE_TTL = 600  # 10 min — options data changes intraday
+_cache = TTLCache(CACHE_TTL)
 
 # EU tickers don't have US-style options chains
 _EU_SUFFIXES = (".PA", ".DE", ".AS", ".SW", ".L")
 
 
+def _fetch_option_chain(ticker: str, expiration: str):
+    """One expiration's chain, on its own yf.Ticker (Ticker state is not shared across threads)."""
+    import yfinance as yf
+    return yf.Ticker(ticker).option_chain(expiration)
+
+
 @router.get("/options/{ticker}")
 async def get_options_sentiment(ticker: str):
     """Analyze put/call ratio for sentiment signal."""
     ticker = ticker.upper()
 
     # Skip EU tickers (no meaningful options data on yfinance)
-    if any(ticker.endswith(s) for s in _EU_SUFFIXES):
+    if ticker.endswith(_EU_SUFFIXES):
         return {"ticker": ticker, "sentiment_score": None, "skipped": "eu_ticker"}
 
-    now = datetime.utcnow().timestamp()
-    if ticker in _cache:
-        cached, ts = _cache[ticker]
-        if now - ts < CACHE_TTL:
-            return cached
+    now = time.monotonic()
+    cached = _cache.get(ticker, now)
+    if cached is not None:
+        return cached
 
     try:
         import yfinance as yf
@@ -42,7 +49,7 @@ async def get_options_sentiment(ticker: str):
 
     if not expirations:
         result = {"ticker": ticker, "sentiment_score": None, "label": "no_options"}
-        _cache[ticker] = (result, now)
+        _cache.set(ticker, result, now)
         return result
 
     # Analyze the 3 nearest expirations
@@ -52,8 +59,11 @@ async def get_options_sentiment(ticker: str):
     total_put_vol = 0
 
     try:
-        for exp in expirations[:3]:
-            chain = await asyncio.to_thread(lambda e=exp: t.option_chain(e))
+        # Expirations are independent — fetch them concurrently, one Ticker per thread
+        chains = await asyncio.gather(
+            *(asyncio.to_thread(_fetch_option_chain, ticker, exp) for exp in expirations[:3])
+        )
+        for chain in chains:
             calls = chain.calls
             puts = chain.puts
 
@@ -64,7 +74,7 @@ async def get_options_sentiment(ticker: str):
     except Exception as e:
         logger.warning("Options chain parse failed for %s: %s", ticker, e)
         result = {"ticker": ticker, "sentiment_score": None, "error": str(e)}
-        _cache[ticker] = (result, now)
+        _cache.set(ticker, result, now)
         return result
 
     pc_ratio_oi = total_put_oi / total_call_oi if total_call_oi > 0 else 1.0
@@ -101,5 +111,5 @@ async def get_options_sentiment(ticker: str):
         "expirations_analyzed": min(len(expirations), 3),
         "label": label,
     }
-    _cache[ticker] = (result, now)
+    _cache.set(ticker, result, now)
     return result
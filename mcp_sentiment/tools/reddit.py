@@ -1,17 +1,24 @@
 import os
 import re
 import logging
+import time
+from functools import lru_cache
 import praw
 from prawcore.exceptions import ResponseException, OAuthException
 from fastapi import APIRouter, HTTPException, Query
 from textblob import TextBlob
 
+from mcp_sentiment.tools._ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/sentiment", tags=["Reddit Sentiment"])
 
 SUBREDDITS = ["wallstreetbets", "stocks", "investing", "vosfinances", "finanzen", "eupersonalfinance"]
 
+CACHE_TTL = 600  # 10 min — hot listings churn slowly
+_cache = TTLCache(CACHE_TTL)
+
 # Module-level Reddit client cache
 _reddit_client = None
 _reddit_init_error = None
@@ -33,12 +40,12 @@ def _get_reddit_client():
 
     if not client_id or not client_secret:
         _reddit_init_error = "Missing REDDIT_CLIENT_ID or REDDIT_CLIENT_SECRET"
-        logger.warning(f"Reddit init skipped: {_reddit_init_error}")
+        logger.warning("Reddit init skipped: %s", _reddit_init_error)
         return None
 
     if client_id == "your_reddit_client_id" or client_secret == "your_reddit_client_secret":
         _reddit_init_error = "Reddit credentials are placeholder values"
-        logger.warning(f"Reddit init skipped: {_reddit_init_error}")
+        logger.warning("Reddit init skipped: %s", _reddit_init_error)
         return None
 
     try:
@@ -76,6 +83,12 @@ def _analyze_sentiment(text: str) -> dict:
     return {"polarity": round(polarity, 3), "label": label}
 
 
+@lru_cache(maxsize=256)
+def _ticker_regex(ticker: str) -> re.Pattern:
+    """Word-boundary, case-insensitive match for a ticker symbol (compiled once per ticker)."""
+    return re.compile(r"\b" + re.escape(ticker) + r"\b", re.IGNORECASE)
+
+
 @router.get("/reddit/{ticker}")
 async def get_reddit_sentiment(
     ticker: str,
@@ -90,7 +103,13 @@ async def get_reddit_sentiment(
         )
 
     ticker_upper = ticker.upper()
-    ticker_pattern = re.compile(r"\b" + re.escape(ticker_upper) + r"\b", re.IGNORECASE)
+    cache_key = (ticker_upper, limit)
+    now = time.monotonic()
+    cached = _cache.get(cache_key, now)
+    if cached is not None:
+        return cached
+
+    ticker_pattern = _ticker_regex(ticker_upper)
 
     all_posts = []
     total_polarity = 0.0
@@ -126,7 +145,7 @@ async def get_reddit_sentiment(
                         "url": f"https://reddit.com{post.permalink}",
                     })
             except Exception as sub_error:
-                logger.warning(f"Error fetching from r/{sub_name}: {sub_error}")
+                logger.warning("Error fetching from r/%s: %s", sub_name, sub_error)
                 continue
 
         mention_count = len(all_posts)
@@ -135,7 +154,7 @@ async def get_reddit_sentiment(
 
         top_posts = sorted(all_posts, key=lambda x: x["score"], reverse=True)[:5]
 
-        return {
+        result = {
             "ticker": ticker_upper,
             "source": "reddit",
             "subreddits": SUBREDDITS,
@@ -149,12 +168,14 @@ async def get_reddit_sentiment(
             },
             "top_posts": top_posts,
         }
+        _cache.set(cache_key, result, now)
+        return result
     except (ResponseException, OAuthException) as e:
-        logger.error(f"Reddit API error for {ticker}: {e}")
+        logger.error("Reddit API error for %s: %s", ticker, e)
         raise HTTPException(
             status_code=502,
             detail=f"Reddit API error: {type(e).__name__}. Check credentials.",
         )
     except Exception as e:
-        logger.error(f"Unexpected error fetching Reddit sentiment for {ticker}: {e}")
+        logger.error("Unexpected error fetching Reddit sentiment for %s: %s", ticker, e)
         raise HTTPException(status_code=500, detail=f"Reddit error: {type(e).__name__}: {str(e)}")
@@ -3,17 +3,32 @@
 import logging
 import os
 import re
+from functools import lru_cache
 from datetime import datetime, timedelta
 
 import httpx
 from fastapi import APIRouter, HTTPException
 
+from mcp_sentiment.tools._keywords import count_keywords, keyword_regex
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/sentiment", tags=["RSS Sentiment"])
 
 MONGODB_URI = os.environ.get("MONGODB_URI", "")
 
+# Shared Motor client (connection pool), created on first request
+_mongo_client = None
+
+
+def _get_articles_collection():
+    """Return raw_articles from a lazily created, process-wide Motor client."""
+    global _mongo_client
+    if _mongo_client is None:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        _mongo_client = AsyncIOMotorClient(MONGODB_URI)
+    return _mongo_client.market_intelligence.raw_articles
+
 # Ticker → company name variants for article matching
 TICKER_NAMES = {
     # ======================== NASDAQ ========================
@@ -115,38 +130,44 @@ BULLISH_EN = {"surge", "rally", "growth", "profit", "beat", "upgrade", "buy", "b
 BEARISH_EN = {"drop", "fall", "loss", "miss", "downgrade", "sell", "bearish", "crash",
               "decline", "weak", "underperform", "layoff", "debt", "warning"}
 
+_BULLISH_RE = keyword_regex(BULLISH_FR | BULLISH_EN)
+_BEARISH_RE = keyword_regex(BEARISH_FR | BEARISH_EN)
+
 
+@lru_cache(maxsize=4096)
 def _compute_article_sentiment(title: str, summary: str) -> float:
-    """Simple keyword-based sentiment for FR + EN articles."""
-    text = (title + " " + (summary or "")).lower()
-    bull_count = sum(1 for w in (BULLISH_FR | BULLISH_EN) if w in text)
-    bear_count = sum(1 for w in (BEARISH_FR | BEARISH_EN) if w in text)
+    """Simple keyword-based sentiment for FR + EN articles (memoized: the same
+    articles are re-scored by every ticker query over the 48h window)."""
+    text = title + " " + (summary or "")
+    bull_count = count_keywords(_BULLISH_RE, text)
+    bear_count = count_keywords(_BEARISH_RE, text)
     total = bull_count + bear_count
     if total == 0:
         return 0.0
     return (bull_count - bear_count) / total  # -1 to +1
 
 
+@lru_cache(maxsize=256)
+def _ticker_name_regex(ticker: str) -> re.Pattern:
+    """Case-insensitive alternation of the company names for a ticker (compiled once per ticker)."""
+    names = TICKER_NAMES.get(ticker, [ticker.lower().split(".")[0]])
+    return re.compile("|".join(re.escape(n) for n in names), re.IGNORECASE)
+
+
 @router.get("/rss/{ticker}")
 async def get_rss_sentiment(ticker: str):
     """Get sentiment from RSS articles mentioning the ticker (last 48h)."""
     ticker = ticker.upper()
-    names = TICKER_NAMES.get(ticker, [ticker.lower().split(".")[0]])
 
     if not MONGODB_URI:
         raise HTTPException(status_code=503, detail="MongoDB not configured")
 
     try:
-        from motor.motor_asyncio import AsyncIOMotorClient
-        client = AsyncIOMotorClient(MONGODB_URI)
-        db = client.market_intelligence
-        collection = db.raw_articles
+        collection = _get_articles_collection()
 
         cutoff = datetime.utcnow() - timedelta(hours=48)
 
-        # Build regex pattern for ticker name matching
-        pattern = "|".join(re.escape(n) for n in names)
-        regex = re.compile(pattern, re.IGNORECASE)
+        regex = _ticker_name_regex(ticker)
 
         # Query articles mentioning the ticker
         cursor = collection.find(
@@ -157,17 +178,21 @@ async def get_rss_sentiment(ticker: str):
                     {"summary": {"$regex": regex}},
                 ],
             },
-            {"title": 1, "summary": 1, "source_feed": 1, "category": 1, "language": 1, "published_at": 1},
+            {"_id": 0, "title": 1, "summary": 1, "source_feed": 1},
         ).limit(50)
 
-        articles = await cursor.to_list(length=50)
-        client.close()
+        # Score articles as they stream off the cursor (no intermediate list of documents)
+        scores = []
+        sources = set()
+        async for a in cursor:
+            scores.append(_compute_article_sentiment(a.get("title", ""), a.get("summary", "")))
+            sources.add(a.get("source_feed", "unknown"))
 
     except Exception as e:
         logger.error("MongoDB query failed for %s: %s", ticker, e)
         raise HTTPException(status_code=503, detail=f"MongoDB error: {e}")
 
-    if not articles:
+    if not scores:
         return {
             "ticker": ticker,
             "sentiment_score": None,
@@ -176,21 +201,13 @@ async def get_rss_sentiment(ticker: str):
             "sources": [],
         }
 
-    # Compute sentiment from articles
-    scores = []
-    sources = set()
-    for a in articles:
-        score = _compute_article_sentiment(a.get("title", ""), a.get("summary", ""))
-        scores.append(score)
-        sources.add(a.get("source_feed", "unknown"))
-
     avg_score = sum(scores) / len(scores) if scores else 0.0
     label = "bullish" if avg_score > 0.1 else ("bearish" if avg_score < -0.1 else "neutral")
 
     return {
         "ticker": ticker,
         "sentiment_score": round(avg_score, 3),
-        "article_count": len(articles),
+        "article_count": len(scores),
         "label": label,
         "sources": list(sources),
         "period": "48h",
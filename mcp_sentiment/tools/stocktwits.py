@@ -3,6 +3,8 @@ import time
 import httpx
 from fastapi import APIRouter, HTTPException
 
+from mcp_sentiment.tools._ttl_cache import TTLCache
+
 router = APIRouter(prefix="/sentiment", tags=["StockTwits Sentiment"])
 
 STOCKTWITS_BASE = os.environ.get(
@@ -16,6 +18,9 @@ DEFAULT_HEADERS = {
 # Shared httpx client (connection pooling)
 _client = httpx.AsyncClient(headers=DEFAULT_HEADERS, timeout=15.0)
 
+CACHE_TTL = 300  # 5 min — the stream barely moves between scans
+_cache = TTLCache(CACHE_TTL)
+
 # Circuit breaker: avoid hammering a blocked API
 _circuit = {"open": False, "last_check": 0.0, "cooldown": 300}  # 5 min cooldown
 
@@ -23,6 +28,12 @@ _circuit = {"open": False, "last_check": 0.0, "cooldown": 300}  # 5 min cooldown
 @router.get("/stocktwits/{ticker}")
 async def get_stocktwits_sentiment(ticker: str):
     """Get StockTwits sentiment for a ticker: bullish/bearish ratio, message volume."""
+    ticker = ticker.upper()
+    now = time.monotonic()
+    cached = _cache.get(ticker, now)
+    if cached is not None:
+        return cached
+
     # Circuit breaker: if API was recently blocked, fail fast
     if _circuit["open"] and (time.time() - _circuit["last_check"]) < _circuit["cooldown"]:
         raise HTTPException(
@@ -31,7 +42,7 @@ async def get_stocktwits_sentiment(ticker: str):
         )
 
     try:
-        resp = await _client.get(f"{STOCKTWITS_BASE}/streams/symbol/{ticker.upper()}.json")
+        resp = await _client.get(f"{STOCKTWITS_BASE}/streams/symbol/{ticker}.json")
 
         if resp.status_code == 403:
             _circuit["open"] = True
@@ -71,8 +82,8 @@ async def get_stocktwits_sentiment(ticker: str):
         sentiment_total = bullish + bearish
         bullish_ratio = round(bullish / sentiment_total, 2) if sentiment_total > 0 else None
 
-        return {
-            "ticker": ticker.upper(),
+        result = {
+            "ticker": ticker,
             "source": "stocktwits",
             "message_count": total,
             "bullish": bullish,
@@ -80,6 +91,8 @@ async def get_stocktwits_sentiment(ticker: str):
             "bullish_ratio": bullish_ratio,
             "recent_messages": recent_messages[:10],
         }
+        _cache.set(ticker, result, now)
+        return result
     except HTTPException:
         raise
     except Exception as e:
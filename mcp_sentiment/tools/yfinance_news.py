@@ -2,17 +2,20 @@
 
 import asyncio
 import logging
-from datetime import datetime
+import time
 
 from fastapi import APIRouter
 
+from mcp_sentiment.tools._keywords import count_keywords, keyword_regex
+from mcp_sentiment.tools._ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/sentiment", tags=["yfinance News"])
 
 # Cache: ticker → (result, timestamp)
-_cache: dict[str, tuple[dict, float]] = {}
 CACHE_TTL = 600  # 10 min — news change frequently, short TTL to stay current
+_cache = TTLCache(CACHE_TTL)
 
 # Reuse keyword sets from rss_sentiment
 BULLISH = {"surge", "rally", "growth", "profit", "beat", "upgrade", "buy", "bullish",
@@ -22,12 +25,14 @@ BEARISH = {"drop", "fall", "loss", "miss", "downgrade", "sell", "bearish", "cras
            "decline", "weak", "underperform", "layoff", "debt", "warning", "cut", "recall",
            "baisse", "chute", "perte", "risque", "licenciement", "alerte"}
 
+_BULLISH_RE = keyword_regex(BULLISH)
+_BEARISH_RE = keyword_regex(BEARISH)
+
 
 def _score_text(text: str) -> float:
     """Keyword sentiment score for a news title/summary."""
-    text = text.lower()
-    bull = sum(1 for w in BULLISH if w in text)
-    bear = sum(1 for w in BEARISH if w in text)
+    bull = count_keywords(_BULLISH_RE, text)
+    bear = count_keywords(_BEARISH_RE, text)
     total = bull + bear
     if total == 0:
         return 0.0
@@ -38,13 +43,12 @@ def _score_text(text: str) -> float:
 async def get_yfinance_news_sentiment(ticker: str):
     """Get sentiment from Yahoo Finance news for a specific ticker."""
     ticker = ticker.upper()
-    now = datetime.utcnow().timestamp()
+    now = time.monotonic()
 
     # Check cache
-    if ticker in _cache:
-        cached, ts = _cache[ticker]
-        if now - ts < CACHE_TTL:
-            return cached
+    cached = _cache.get(ticker, now)
+    if cached is not None:
+        return cached
 
     try:
         import yfinance as yf
@@ -66,7 +70,7 @@ async def get_yfinance_news_sentiment(ticker: str):
             "article_count": 0,
             "label": "no_data",
         }
-        _cache[ticker] = (result, now)
+        _cache.set(ticker, result, now)
         return result
 
     scores = []
@@ -92,5 +96,5 @@ async def get_yfinance_news_sentiment(ticker: str):
         "label": label,
         "top_articles": articles[:5],
     }
-    _cache[ticker] = (result, now)
+    _cache.set(ticker, result, now)
     return result
@@ -2,6 +2,8 @@ import os
 import sys
 import logging
 
+import httpx
+
 logger = logging.getLogger(__name__)
 
 # Add routers path
@@ -10,7 +12,7 @@ ROUTERS_PATH = os.environ.get("ROUTERS_PATH")
 if ROUTERS_PATH and os.path.isdir(ROUTERS_PATH):
     sys.path.insert(0, ROUTERS_PATH)
 else:
-    logger.warning(f"ROUTERS_PATH '{ROUTERS_PATH}' does not exist.")
+    logger.warning("ROUTERS_PATH '%s' does not exist.", ROUTERS_PATH)
 
 
 # Load environment variables
@@ -40,10 +42,12 @@ except ValueError:
 
 BASE_URL = f"{GATEWAY_INTERNAL_BASE_URL}:{GATEWAY_PORT}{GATEWAY_ENDPOINT}"
 
-# NOTE: All routers use httpx.AsyncClient(verify=False) when calling BASE_URL.
+# NOTE: All routers call BASE_URL through this shared httpx.AsyncClient(verify=False).
 # This is intentional — the IB Client Portal Gateway uses a self-signed certificate.
 # The gateway runs in a sibling Docker container on the same bridge network (mcp_net),
 # so MITM risk is negligible. Do NOT change to verify=True without importing the IB CA cert.
+# One client per process keeps TLS connections to the gateway alive across requests.
+gateway_client = httpx.AsyncClient(verify=False)
 
 # Create FastAPI object description based on filters
 base_description = """
@@ -91,10 +95,10 @@ else:
     EXCLUDED_TAGS_SET = {}
 
 # Dynamically build the list of available modules.
-module_list_str = "\n**Available Modules:**\n\n"
 # Sort the items alphabetically for consistent output.
-for name, desc in sorted(display_modules.items()):
-    module_list_str += f"* **{name}**: {desc}\n"
+module_list_str = "\n**Available Modules:**\n\n" + "".join(
+    f"* **{name}**: {desc}\n" for name, desc in sorted(display_modules.items())
+)
 
 # Combine the base description with the dynamic module list.
 FINAL_DESCRIPTION = base_description + module_list_str
@@ -4,7 +4,7 @@ from fastapi.responses import Response
 from typing import List, Optional, Any
 import httpx
 from pydantic import BaseModel, Field, ConfigDict
-from mcp_server.config import BASE_URL
+from mcp_server.config import BASE_URL, gateway_client
 
 router = APIRouter()
 
@@ -78,16 +78,15 @@ async def get_scanner_params():
     """
     Retrieves the iServer scanner parameters as an XML file. This information is needed to correctly configure an iServer scanner request.
     """
-    async with httpx.AsyncClient(verify=False) as client:
-        try:
-            response = await client.get(f"{BASE_URL}/iserver/scanner/params", timeout=10)
-            response.raise_for_status()
-            # Return the raw XML content with the correct media type
-            return Response(content=response.text, media_type="application/xml")
-        except httpx.HTTPStatusError as exc:
-            return {"error": "IBKR API Error", "status_code": exc.response.status_code, "detail": exc.response.text}
-        except httpx.RequestError as exc:
-            return {"error": "Request Error", "detail": str(exc)}
+    try:
+        response = await gateway_client.get(f"{BASE_URL}/iserver/scanner/params", timeout=10)
+        response.raise_for_status()
+        # Return the raw XML content with the correct media type
+        return Response(content=response.text, media_type="application/xml")
+    except httpx.HTTPStatusError as exc:
+        return {"error": "IBKR API Error", "status_code": exc.response.status_code, "detail": exc.response.text}
+    except httpx.RequestError as exc:
+        return {"error": "Request Error", "detail": str(exc)}
 
 @router.post(
     "/iserver/scanner/run",
@@ -101,30 +100,29 @@ async def run_scanner(body: ScannerSubscription = Body(...)):
     The JSON request body will be converted to the required XML format.
     """
     # Build the XML string from the Pydantic model
-    xml_string = f"<ScannerSubscription><instrument>{body.instrument}</instrument><type>{body.type}</type><locationCode>{body.locationCode}</locationCode>"
+    parts = [f"<ScannerSubscription><instrument>{body.instrument}</instrument><type>{body.type}</type><locationCode>{body.locationCode}</locationCode>"]
     if body.filter:
-        xml_string += "<filter>"
-        for item in body.filter:
-            xml_string += f"<item><name>{item.name}</name><value>{item.value}</value></item>"
-        xml_string += "</filter>"
-    xml_string += "</ScannerSubscription>"
+        parts.append("<filter>")
+        parts.extend(f"<item><name>{item.name}</name><value>{item.value}</value></item>" for item in body.filter)
+        parts.append("</filter>")
+    parts.append("</ScannerSubscription>")
+    xml_string = "".join(parts)
 
     headers = {"Content-Type": "application/xml"}
 
-    async with httpx.AsyncClient(verify=False) as client:
-        try:
-            response = await client.post(
-                f"{BASE_URL}/iserver/scanner/run",
-                content=xml_string,
-                headers=headers,
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as exc:
-            return {"error": "IBKR API Error", "status_code": exc.response.status_code, "detail": exc.response.text}
-        except httpx.RequestError as exc:
-            return {"error": "Request Error", "detail": str(exc)}
+    try:
+        response = await gateway_client.post(
+            f"{BASE_URL}/iserver/scanner/run",
+            content=xml_string,
+            headers=headers,
+            timeout=30
+        )
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as exc:
+        return {"error": "IBKR API Error", "status_code": exc.response.status_code, "detail": exc.response.text}
+    except httpx.RequestError as exc:
+        return {"error": "Request Error", "detail": str(exc)}
 
 @router.post(
     "/hmds/scanner",
@@ -140,22 +138,21 @@ async def run_hmds_scanner(body: HmdsScannerRequest = Body(...)):
 
     The request body should be a JSON object specifying the scanner parameters.
     """
-    async with httpx.AsyncClient(verify=False) as client:
-        try:
-            # Initialize HMDS session to prevent 404 error on the first call
-            # This is a prerequisite for all /hmds endpoints.
-            init_response = await client.get(f"{BASE_URL}/hmds/auth/init", timeout=10)
-            init_response.raise_for_status() # Ensure the init call was successful
-
-            # Now, make the actual scanner request
-            scanner_response = await client.post(
-                f"{BASE_URL}/hmds/scanner",
-                json=body.model_dump(),
-                timeout=30
-            )
-            scanner_response.raise_for_status()
-            return scanner_response.json()
-        except httpx.HTTPStatusError as exc:
-            return {"error": "IBKR API Error", "status_code": exc.response.status_code, "detail": exc.response.text}
-        except httpx.RequestError as exc:
-            return {"error": "Request Error", "detail": str(exc)}
+    try:
+        # Initialize HMDS session to prevent 404 error on the first call
+        # This is a prerequisite for all /hmds endpoints.
+        init_response = await gateway_client.get(f"{BASE_URL}/hmds/auth/init", timeout=10)
+        init_response.raise_for_status() # Ensure the init call was successful
+
+        # Now, make the actual scanner request
+        scanner_response = await gateway_client.post(
+            f"{BASE_URL}/hmds/scanner",
+            json=body.model_dump(),
+            timeout=30
+        )
+        scanner_response.raise_for_status()
+        return scanner_response.json()
+    except httpx.HTTPStatusError as exc:
+        return {"error": "IBKR API Error", "status_code": exc.response.status_code, "detail": exc.response.text}
+    except httpx.RequestError as exc:
+        return {"error": "Request Error", "detail": str(exc)}
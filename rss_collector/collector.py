@@ -99,11 +99,8 @@ async def _filter_new_articles(articles: list[dict]) -> list[dict]:
         return []
     db = await get_db()
     url_hashes = [a["url_hash"] for a in articles]
-    existing = await db.raw_articles.find(
-        {"url_hash": {"$in": url_hashes}},
-        {"url_hash": 1},
-    ).to_list(length=len(url_hashes))
-    existing_hashes = {doc["url_hash"] for doc in existing}
+    # distinct() returns bare hash strings (served from the url_hash index), not one document per match
+    existing_hashes = set(await db.raw_articles.distinct("url_hash", {"url_hash": {"$in": url_hashes}}))
     return [a for a in articles if a["url_hash"] not in existing_hashes]
 
 
@@ -1,8 +1,10 @@
+import asyncio
 import logging
 import os
 from datetime import datetime
 
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,28 @@ async def get_db():
     return _db
 
 
+# (collection, keys, options) — each created on its own so one conflict doesn't skip the rest
+_INDEXES = (
+    ("raw_articles", "url_hash", {"unique": True}),
+    ("raw_articles", [("sent_to_openclaw", 1), ("collected_at", -1)], {}),
+    ("raw_articles", "collected_at", {}),
+    ("pipeline_runs", [("run_type", 1), ("started_at", -1)], {}),
+)
+
+
+async def ensure_indexes():
+    """Create the indexes used by dedup, push and stats queries (idempotent)."""
+    db = await get_db()
+    created = 0
+    for collection, keys, options in _INDEXES:
+        try:
+            await db[collection].create_index(keys, **options)
+            created += 1
+        except Exception as e:
+            logger.warning("MongoDB index %s on %s failed: %s", keys, collection, e)
+    logger.info("MongoDB indexes ensured (%d/%d)", created, len(_INDEXES))
+
+
 async def close_db():
     global _client, _db
     if _client:
@@ -31,28 +55,31 @@ async def close_db():
 
 
 async def insert_articles(articles: list[dict]) -> int:
+    """Insert articles not already stored (keyed on url_hash); returns the number inserted."""
     db = await get_db()
     if not articles:
         return 0
-    try:
-        result = await db.raw_articles.insert_many(articles, ordered=False)
-        return len(result.inserted_ids)
-    except Exception as e:
-        # BulkWriteError with duplicates is expected
-        if "duplicate key" in str(e).lower() or "E11000" in str(e):
-            # Count how many were actually inserted
-            inserted = getattr(getattr(e, "details", None), "get", lambda *a: 0)("nInserted", 0)
-            if hasattr(e, "details") and isinstance(e.details, dict):
-                inserted = e.details.get("nInserted", 0)
-            logger.info("Bulk insert: %d new articles (duplicates skipped)", inserted)
-            return inserted
-        raise
+    # Upsert-if-absent: duplicates are no-ops instead of E11000 errors to catch and parse
+    ops = [UpdateOne({"url_hash": a["url_hash"]}, {"$setOnInsert": a}, upsert=True) for a in articles]
+    result = await db.raw_articles.bulk_write(ops, ordered=False)
+    inserted = result.upserted_count
+    if inserted < len(articles):
+        logger.info("Bulk insert: %d new articles (%d duplicates skipped)", inserted, len(articles) - inserted)
+    return inserted
+
+
+# Fields read by the OpenClaw/Ollama batch prompts and intelligence records
+_UNSENT_PROJECTION = {
+    "_id": 0, "url_hash": 1, "url": 1, "title": 1, "summary": 1, "full_text": 1,
+    "source_feed": 1, "category": 1, "published_at": 1,
+}
 
 
 async def get_unsent_articles(limit: int = 50) -> list[dict]:
     db = await get_db()
     cursor = db.raw_articles.find(
         {"sent_to_openclaw": False},
+        _UNSENT_PROJECTION,
         sort=[("collected_at", -1)],
     ).limit(limit)
     return await cursor.to_list(length=limit)
@@ -82,16 +109,16 @@ async def log_pipeline_run(run_type: str, stats: dict):
 
 async def get_stats() -> dict:
     db = await get_db()
-    total_articles = await db.raw_articles.count_documents({})
-    unsent = await db.raw_articles.count_documents({"sent_to_openclaw": False})
-    total_intelligence = await db.market_intelligence.count_documents({})
-    total_runs = await db.pipeline_runs.count_documents({})
-
-    last_collection = await db.pipeline_runs.find_one(
-        {"run_type": "collection"}, sort=[("started_at", -1)]
-    )
-    last_push = await db.pipeline_runs.find_one(
-        {"run_type": "openclaw_push"}, sort=[("started_at", -1)]
+    # Independent queries — run them concurrently instead of 6 sequential round trips
+    (
+        total_articles, unsent, total_intelligence, total_runs, last_collection, last_push,
+    ) = await asyncio.gather(
+        db.raw_articles.estimated_document_count(),
+        db.raw_articles.count_documents({"sent_to_openclaw": False}),
+        db.market_intelligence.estimated_document_count(),
+        db.pipeline_runs.estimated_document_count(),
+        db.pipeline_runs.find_one({"run_type": "collection"}, sort=[("started_at", -1)]),
+        db.pipeline_runs.find_one({"run_type": "openclaw_push"}, sort=[("started_at", -1)]),
     )
 
     return {
@@ -8,6 +8,7 @@ import asyncio
 import json
 import logging
 import os
+import re
 import uuid
 from datetime import datetime
 
@@ -25,6 +26,18 @@ logger = logging.getLogger(__name__)
 OLLAMA_URL = os.environ.get("OLLAMA_URL", "http://192.168.1.120:11434")
 OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL", "llama3.2:3b")
 
+_client = httpx.AsyncClient(timeout=60.0)
+
+# Markdown code fence around a JSON reply: captures the body, closing fence optional
+_CODE_FENCE_RE = re.compile(r"```[^\n]*\n(.*?)(?:```)?\s*\Z", re.DOTALL)
+
+
+def strip_code_fence(text: str) -> str:
+    """Strip surrounding whitespace and a Markdown code fence, if any, from an LLM reply."""
+    text = text.strip()
+    fenced = _CODE_FENCE_RE.match(text)
+    return fenced.group(1).strip() if fenced else text
+
 
 def _format_articles_for_prompt(articles: list[dict]) -> str:
     """Format articles into a text prompt (same as openclaw_client)."""
@@ -50,24 +63,23 @@ async def _send_to_ollama(articles: list[dict], batch_id: str) -> dict | None:
     max_retries = 2
     for attempt in range(max_retries):
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                resp = await client.post(
-                    f"{OLLAMA_URL}/api/generate",
-                    json={
-                        "model": OLLAMA_MODEL,
-                        "system": SYSTEM_PROMPT,
-                        "prompt": prompt,
-                        "stream": False,
-                        "options": {"num_predict": 1024, "temperature": 0.2},
-                    },
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    return {"text": data.get("response", "")}
-                logger.warning(
-                    "Ollama returned %d (attempt %d/%d)",
-                    resp.status_code, attempt + 1, max_retries,
-                )
+            resp = await _client.post(
+                f"{OLLAMA_URL}/api/generate",
+                json={
+                    "model": OLLAMA_MODEL,
+                    "system": SYSTEM_PROMPT,
+                    "prompt": prompt,
+                    "stream": False,
+                    "options": {"num_predict": 1024, "temperature": 0.2},
+                },
+            )
+            if resp.status_code == 200:
+                data = resp.json()
+                return {"text": data.get("response", "")}
+            logger.warning(
+                "Ollama returned %d (attempt %d/%d)",
+                resp.status_code, attempt + 1, max_retries,
+            )
         except httpx.TimeoutException:
             logger.warning("Ollama timeout (attempt %d/%d)", attempt + 1, max_retries)
         except Exception as e:
@@ -89,14 +101,7 @@ def _parse_intelligence(response_data: dict, batch_id: str, articles: list[dict]
             logger.warning("No text content in Ollama response")
             return None
 
-        text = output_text.strip()
-        if text.startswith("```"):
-            text = text.split("\n", 1)[-1]
-            if text.endswith("```"):
-                text = text[:-3]
-            text = text.strip()
-
-        parsed = json.loads(text)
+        parsed = json.loads(strip_code_fence(output_text))
 
         return {
             "batch_id": batch_id,
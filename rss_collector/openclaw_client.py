@@ -2,6 +2,7 @@ import asyncio
 import json
 import logging
 import os
+import random
 import uuid
 from datetime import datetime
 
@@ -12,12 +13,15 @@ from rss_collector.mongo_client import (
     mark_articles_sent,
     store_intelligence,
 )
+from rss_collector.ollama_analyzer import strip_code_fence
 from rss_collector.prompts import SYSTEM_PROMPT
 
 logger = logging.getLogger(__name__)
 
 _last_request_time: float = 0
 
+_client = httpx.AsyncClient(timeout=120.0)
+
 
 def _format_articles_for_prompt(articles: list[dict]) -> str:
     """Format articles into a text prompt for OpenClaw."""
@@ -69,27 +73,27 @@ async def _send_to_openclaw(articles: list[dict], batch_id: str) -> dict | None:
     max_retries = 3
     for attempt in range(max_retries):
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                _last_request_time = asyncio.get_event_loop().time()
-                response = await client.post(api_url, json=payload, headers=headers)
-
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 429 or response.status_code >= 500:
-                    wait = (2 ** attempt) * 10
-                    logger.warning(
-                        "OpenClaw returned %d, retrying in %ds (attempt %d/%d)",
-                        response.status_code, wait, attempt + 1, max_retries,
-                    )
-                    await asyncio.sleep(wait)
-                else:
-                    logger.error(
-                        "OpenClaw error %d: %s", response.status_code, response.text[:500]
-                    )
-                    return None
+            _last_request_time = asyncio.get_event_loop().time()
+            response = await _client.post(api_url, json=payload, headers=headers)
+
+            if response.status_code == 200:
+                return response.json()
+            elif response.status_code == 429 or response.status_code >= 500:
+                # Jitter so the collector and scoring engine don't retry in lockstep
+                wait = (2 ** attempt) * 10 + random.uniform(0, 5)
+                logger.warning(
+                    "OpenClaw returned %d, retrying in %.1fs (attempt %d/%d)",
+                    response.status_code, wait, attempt + 1, max_retries,
+                )
+                await asyncio.sleep(wait)
+            else:
+                logger.error(
+                    "OpenClaw error %d: %s", response.status_code, response.text[:500]
+                )
+                return None
         except httpx.TimeoutException:
-            wait = (2 ** attempt) * 15
-            logger.warning("OpenClaw timeout, retrying in %ds", wait)
+            wait = (2 ** attempt) * 15 + random.uniform(0, 5)
+            logger.warning("OpenClaw timeout, retrying in %.1fs", wait)
             await asyncio.sleep(wait)
         except Exception as e:
             logger.error("OpenClaw request failed: %s", e)
@@ -126,14 +130,7 @@ def _parse_intelligence(response_data: dict, batch_id: str, articles: list[dict]
 
         # Try to parse JSON from the response
         # Strip markdown code fences if present
-        text = output_text.strip()
-        if text.startswith("```"):
-            text = text.split("\n", 1)[-1]
-            if text.endswith("```"):
-                text = text[:-3]
-            text = text.strip()
-
-        parsed = json.loads(text)
+        parsed = json.loads(strip_code_fence(output_text))
 
         return {
             "batch_id": batch_id,
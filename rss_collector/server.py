@@ -9,7 +9,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import FastAPI
 
 from rss_collector.collector import run_collection_cycle
-from rss_collector.mongo_client import close_db, get_stats, log_pipeline_run
+from rss_collector.mongo_client import close_db, ensure_indexes, get_stats, log_pipeline_run
 from rss_collector.ollama_analyzer import run_ollama_push
 
 logging.basicConfig(
@@ -18,7 +18,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-scheduler = AsyncIOScheduler()
+scheduler = AsyncIOScheduler(
+    job_defaults={"max_instances": 1, "coalesce": True, "misfire_grace_time": 60},
+)
 
 
 async def _collection_job():
@@ -31,10 +33,25 @@ async def _collection_job():
         logger.error("Collection cycle failed (unexpected): %s", e, exc_info=True)
 
 
+# Adaptive push interval: back off (x2, up to 4x base) while there is nothing to push,
+# snap back to the base interval as soon as a batch goes out.
+_push_interval = {"base": 20, "current": 20}
+
+
+def _adapt_push_interval(had_work: bool) -> None:
+    base, current = _push_interval["base"], _push_interval["current"]
+    target = base if had_work else min(current * 2, base * 4)
+    if target != current:
+        _push_interval["current"] = target
+        scheduler.reschedule_job("push", trigger="interval", minutes=target)
+        logger.info("Push interval now %dm", target)
+
+
 async def _push_job():
     try:
         stats = await run_ollama_push()
         await log_pipeline_run("ollama_push", stats)
+        _adapt_push_interval(stats.get("articles_sent", 0) > 0)
     except (httpx.HTTPError, asyncio.TimeoutError) as e:
         logger.error("Ollama push failed (network): %s", e)
     except Exception as e:
@@ -46,6 +63,8 @@ async def lifespan(app: FastAPI):
     collect_interval = int(os.environ.get("RSS_COLLECT_INTERVAL_MINUTES", "15"))
     push_interval = int(os.environ.get("RSS_PUSH_INTERVAL_MINUTES", "20"))
 
+    _push_interval["base"] = _push_interval["current"] = push_interval
+
     scheduler.add_job(_collection_job, "interval", minutes=collect_interval, id="collection")
     scheduler.add_job(_push_job, "interval", minutes=push_interval, id="push")
     scheduler.start()
@@ -54,8 +73,9 @@ async def lifespan(app: FastAPI):
         collect_interval, push_interval,
     )
 
-    # Schedule first collection as background task (non-blocking startup)
+    # Index creation and first collection as background tasks (non-blocking startup)
     import asyncio
+    asyncio.create_task(ensure_indexes())
     asyncio.create_task(_collection_job())
 
     yield
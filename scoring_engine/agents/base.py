@@ -2,6 +2,7 @@
 
 import json
 import logging
+import re
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, asdict
@@ -12,8 +13,18 @@ from scoring_engine.config import OLLAMA_URL, OLLAMA_MODEL
 
 logger = logging.getLogger(__name__)
 
+# Markdown code fence around a JSON reply: captures the body, closing fence optional
+_CODE_FENCE_RE = re.compile(r"```[^\n]*\n(.*?)(?:```)?\s*\Z", re.DOTALL)
 
-@dataclass
+
+def strip_code_fence(text: str) -> str:
+    """Strip surrounding whitespace and a Markdown code fence, if any, from an LLM reply."""
+    text = text.strip()
+    fenced = _CODE_FENCE_RE.match(text)
+    return fenced.group(1).strip() if fenced else text
+
+
+@dataclass(slots=True)
 class AnalystReport:
     agent_name: str
     ticker: str
@@ -55,13 +66,7 @@ class OllamaClient:
             raw = (resp.json().get("response") or "").strip()
 
             # Try JSON parse
-            text = raw
-            if text.startswith("```"):
-                text = text.split("\n", 1)[-1]
-                if text.endswith("```"):
-                    text = text[:-3]
-                text = text.strip()
-            return json.loads(text)
+            return json.loads(strip_code_fence(raw))
         except json.JSONDecodeError:
             return {"raw": raw, "_parse_error": True}
         except (httpx.HTTPError, httpx.TimeoutException) as e:
@@ -1,6 +1,7 @@
 """Macro Analyst — market regime detection + sector rotation + Ollama narrative."""
 
 import logging
+import re
 
 from scoring_engine.agents.base import AnalystAgent, AnalystReport, OllamaClient
 from scoring_engine.config import TICKER_SECTORS
@@ -27,13 +28,32 @@ _SECTOR_MAP = {
 }
 
 
+# Market-overview items we read, by Yahoo symbol (exact match, checked first)
+_MARKET_SYMBOLS = {"^VIX": "vix", "^GSPC": "sp500", "^TNX": "treasury_10y", "DX-Y.NYB": "dxy"}
+# Fallback on the display name when the symbol is missing or unexpected
+_MARKET_NAME_RE = re.compile(r"(?P<vix>vix)|(?P<sp500>s&p)|(?P<treasury_10y>10y|10 year)|(?P<dxy>dollar)", re.IGNORECASE)
+
+
+def _classify_market(item: dict) -> str | None:
+    """Which macro indicator a market-overview item is (vix/sp500/treasury_10y/dxy), if any."""
+    kind = _MARKET_SYMBOLS.get(item.get("symbol", "").upper())
+    if kind:
+        return kind
+    m = _MARKET_NAME_RE.search(item.get("name", ""))
+    return m.lastgroup if m else None
+
+
+# (VIX upper bound, regime), checked in order
+_VIX_REGIMES = ((15, "bullish"), (25, "neutral"))
+_REGIME_SCORES = {"bullish": 0.3, "neutral": 0.0, "bearish": -0.3, "unknown": 0.0}
+
+
 def _detect_regime(vix: float | None) -> str:
     if vix is None:
         return "unknown"
-    if vix < 15:
-        return "bullish"
-    if vix < 25:
-        return "neutral"
+    for bound, regime in _VIX_REGIMES:
+        if vix < bound:
+            return regime
     return "bearish"
 
 
@@ -50,6 +70,21 @@ def _format_prompt(ticker: str, regime: str, vix, sp500_change, treasury_10y, dx
     )
 
 
+def extract_market_indicators(macro: dict) -> dict:
+    """VIX, S&P 500 daily change, US 10y yield and DXY from a market-overview payload."""
+    indicators = {"vix": None, "sp500_change": None, "treasury_10y": None, "dxy": None}
+    markets = macro.get("markets")
+    if not isinstance(markets, list):
+        return indicators
+    for item in markets:
+        kind = _classify_market(item)
+        if kind == "sp500":
+            indicators["sp500_change"] = item.get("change_percent")
+        elif kind:
+            indicators[kind] = item.get("price") or item.get("value")
+    return indicators
+
+
 class MacroAnalyst(AnalystAgent):
     name = "macro"
 
@@ -57,33 +92,17 @@ class MacroAnalyst(AnalystAgent):
         macro = context.get("macro") or {}
         sectors = context.get("sectors") or {}
 
-        markets = macro.get("markets") or {}
-        # Extract key indices
-        vix = None
-        sp500_change = None
-        treasury_10y = None
-        dxy = None
-
-        if not isinstance(markets, (list, dict)):
-            markets = {}
-
-        for item in markets if isinstance(markets, list) else []:
-            name = item.get("name", "").lower()
-            sym = item.get("symbol", "").upper()
-            if "vix" in name or sym == "^VIX":
-                vix = item.get("price") or item.get("value")
-            elif "s&p" in name or sym == "^GSPC":
-                sp500_change = item.get("change_percent")
-            elif ("10y" in name or "10 year" in name or sym == "^TNX"):
-                treasury_10y = item.get("price") or item.get("value")
-            elif "dollar" in name or sym == "DX-Y.NYB":
-                dxy = item.get("price") or item.get("value")
+        # Key indices: precomputed once per scan by the pipeline, else parsed here
+        indicators = context.get("indicators") or extract_market_indicators(macro)
+        vix = indicators["vix"]
+        sp500_change = indicators["sp500_change"]
+        treasury_10y = indicators["treasury_10y"]
+        dxy = indicators["dxy"]
 
         regime = _detect_regime(vix)
 
         # Score based on regime
-        regime_scores = {"bullish": 0.3, "neutral": 0.0, "bearish": -0.3, "unknown": 0.0}
-        score = regime_scores.get(regime, 0.0)
+        score = _REGIME_SCORES.get(regime, 0.0)
 
         # Sector rotation bonus/malus
         ticker_sector = TICKER_SECTORS.get(ticker, "unknown")
@@ -111,16 +130,19 @@ class MacroAnalyst(AnalystAgent):
         if sector_rank is not None:
             reasons.append(f"Secteur {ticker_sector} rang {sector_rank}/{len(sector_data)}")
 
-        # Ollama narrative report
-        result = await _ollama.generate(
-            system_prompt=SYSTEM,
-            user_prompt=_format_prompt(ticker, regime, vix, sp500_change, treasury_10y, dxy, ticker_sector, sector_rank, total_sectors),
-            max_tokens=200,
-            temperature=0.3,
-        )
-        narrative = result.get("raw", result.get("summary", ""))
-        if not narrative or result.get("_error"):
+        # Ollama narrative report — skipped when every macro input is missing (prompt would be all '?')
+        if all(v is None for v in (vix, sp500_change, treasury_10y, dxy, sector_rank)):
             narrative = ", ".join(reasons)
+        else:
+            result = await _ollama.generate(
+                system_prompt=SYSTEM,
+                user_prompt=_format_prompt(ticker, regime, vix, sp500_change, treasury_10y, dxy, ticker_sector, sector_rank, total_sectors),
+                max_tokens=200,
+                temperature=0.3,
+            )
+            narrative = result.get("raw", result.get("summary", ""))
+            if not narrative or result.get("_error"):
+                narrative = ", ".join(reasons)
 
         return AnalystReport(
             agent_name=self.name,
@@ -32,23 +32,25 @@ class SentimentAnalyst(AnalystAgent):
 
     async def analyze(self, ticker: str, context: dict) -> AnalystReport:
         sentiment = context.get("sentiment") or {}
-        unified = sentiment.get("unified_score")
-        if unified is None:
-            unified = 0
-        unified = float(unified)
+        raw_unified = sentiment.get("unified_score")
+        unified = float(raw_unified) if raw_unified is not None else 0.0
         label = sentiment.get("unified_label", "neutral")
         sources = sentiment.get("sources_used", [])
+        fallback = f"Sentiment {label} ({unified:+.2f}), {len(sources)} sources"
 
-        # Ollama narrative report
-        result = await _ollama.generate(
-            system_prompt=SYSTEM,
-            user_prompt=_format_prompt(ticker, unified, label, sources, sentiment),
-            max_tokens=200,
-            temperature=0.3,
-        )
-        narrative = result.get("raw", result.get("summary", ""))
-        if not narrative or result.get("_error"):
-            narrative = f"Sentiment {label} ({unified:+.2f}), {len(sources)} sources"
+        # Ollama narrative report — skipped when there is no sentiment data to narrate
+        if raw_unified is None and not sources:
+            narrative = fallback
+        else:
+            result = await _ollama.generate(
+                system_prompt=SYSTEM,
+                user_prompt=_format_prompt(ticker, unified, label, sources, sentiment),
+                max_tokens=200,
+                temperature=0.3,
+            )
+            narrative = result.get("raw", result.get("summary", ""))
+            if not narrative or result.get("_error"):
+                narrative = fallback
 
         return AnalystReport(
             agent_name=self.name,
@@ -17,6 +17,30 @@ COLOR_SELL = 0xFF1744    # red
 COLOR_HOLD = 0xFFA000    # amber
 COLOR_INFO = 0x2196F3    # blue
 
+EMBED_DESCRIPTION_MAX = 4096  # Discord embed description limit
+
+# Static formatting tables (built once at import, not per alert)
+_VERDICT_EMOJI = {"BUY": "🟢", "SELL": "🔴", "HOLD": "⚠️"}
+_VERDICT_COLOR = {"BUY": COLOR_BUY, "SELL": COLOR_SELL, "HOLD": COLOR_HOLD}
+_RANKING_EMOJI = {"BUY": "🟢", "SELL": "🔴", "HOLD": "🟡", "WATCH": "👀"}
+_RANK_MEDALS = {1: "🥇", 2: "🥈", 3: "🥉"}
+_AGENT_ICONS = {"technical": "📊", "fundamental": "📈", "macro": "🌍", "sentiment": "💬"}
+_FILTER_LABELS = {
+    "price_above_sma20": "Au-dessus de sa moyenne 20 jours",
+    "trend_5d_positive": "Tendance 5 jours positive",
+    "rsi_below_threshold": "Pas en zone de surachat",
+    "price_above_sma200": "Au-dessus de sa moyenne 200 jours",
+    "atr_relative_ok": "Volatilité maîtrisée",
+}
+
+
+def _score_label(s: float) -> str:
+    if s >= 0.5: return "très positive"
+    if s >= 0.1: return "positive"
+    if s > -0.1: return "neutre"
+    if s > -0.5: return "négative"
+    return "très négative"
+
 
 async def send_discord_embed(embeds: list[dict]) -> bool:
     """Send rich embed to Discord #signaux-agent channel."""
@@ -48,8 +72,8 @@ async def alert_signal(
     bull_case: str = "", bear_case: str = "", openclaw_risk: str = "",
 ) -> None:
     """Send signal alert to Discord #signaux-agent."""
-    emoji = {"BUY": "🟢", "SELL": "🔴", "HOLD": "⚠️"}.get(verdict, "❓")
-    color = {"BUY": COLOR_BUY, "SELL": COLOR_SELL, "HOLD": COLOR_HOLD}.get(verdict, COLOR_INFO)
+    emoji = _VERDICT_EMOJI.get(verdict, "❓")
+    color = _VERDICT_COLOR.get(verdict, COLOR_INFO)
 
     filter_lines = []
     if filters:
@@ -85,7 +109,7 @@ async def alert_signal(
         for ar in analyst_reports:
             name = ar.get("agent_name", "?")
             s = ar.get("score", 0)
-            icon = {"technical": "📊", "fundamental": "📈", "macro": "🌍", "sentiment": "💬"}.get(name, "•")
+            icon = _AGENT_ICONS.get(name, "•")
             agent_parts.append(f"{icon} {name.title()}: {s:+.2f}")
         fields.append({"name": "Analystes", "value": " | ".join(agent_parts), "inline": False})
 
@@ -134,6 +158,8 @@ async def alert_scan_summary(market: str, results: list[dict], openclaw_verdicts
     from scoring_engine.config import TICKER_INFO, TICKER_SECTORS, TICKER_DESCRIPTION
 
     valid = [r for r in results if not r.get("error") and r.get("score")]
+    if not valid:
+        return
 
     # Sort by openclaw rank if available, else by score
     if any(r.get("openclaw_rank") for r in valid):
@@ -141,11 +167,14 @@ async def alert_scan_summary(market: str, results: list[dict], openclaw_verdicts
     else:
         valid.sort(key=lambda r: (r["score"]["score"], r.get("llm", {}).get("confidence", 0)), reverse=True)
 
-    if not valid:
-        return
+    # One timestamp for the whole report (ranking + BUY cards)
+    timestamp = datetime.utcnow().isoformat()
 
     # --- MESSAGE 1: Compact ranking table ---
+    # Same pass also collects the BUY cards (conviction >= 60%) and whether Grok contributed
     lines = []
+    buy_results = []
+    has_grok = False
     for rank, r in enumerate(valid, 1):
         s = r["score"]
         l = r.get("llm", {})
@@ -163,12 +192,16 @@ async def alert_scan_summary(market: str, results: list[dict], openclaw_verdicts
         fund = reports.get("fundamental", 0)
         tech = reports.get("technical", 0)
 
-        medal = {1: "🥇", 2: "🥈", 3: "🥉"}.get(rank, f"` {rank:2d}`")
-        v_emoji = {"BUY": "🟢", "SELL": "🔴", "HOLD": "🟡", "WATCH": "👀"}.get(verdict, "⚪")
+        medal = _RANK_MEDALS.get(rank) or f"` {rank:2d}`"
+        v_emoji = _RANKING_EMOJI.get(verdict, "⚪")
 
         lines.append(
             f"{medal} **{name}** {flag}  {score}/5  {v_emoji}{verdict} {conf}%  ${price:.0f}  📈{fund:+.1f} 📊{tech:+.1f}"
         )
+        if verdict == "BUY" and conf >= 60:
+            buy_results.append(r)
+        if r.get("grok_report"):
+            has_grok = True
 
     # Market comment from OpenClaw
     market_comment = ""
@@ -186,15 +219,13 @@ async def alert_scan_summary(market: str, results: list[dict], openclaw_verdicts
         "title": f"📊 Scan {market} — {len(valid)} tickers",
         "description": "\n".join(lines) + market_comment + alerts_text,
         "color": COLOR_INFO,
-        "timestamp": datetime.utcnow().isoformat(),
-        "footer": {"text": "Trading Agent v2 | Classement par OpenClaw (Claude & Grok)" if any(r.get("grok_report") for r in valid) else "Trading Agent v2 | Classement par OpenClaw (Claude)"},
+        "timestamp": timestamp,
+        "footer": {"text": "Trading Agent v2 | Classement par OpenClaw (Claude & Grok)" if has_grok else "Trading Agent v2 | Classement par OpenClaw (Claude)"},
     }
     await send_discord_embed([ranking_embed])
 
     # --- MESSAGE 2: Top 5 detailed embeds ---
-    # Only show detailed cards for BUY verdicts
     # BUY cards only (conviction >= 60%). WATCH stays internal.
-    buy_results = [r for r in valid if r.get("llm", {}).get("verdict") == "BUY" and r.get("llm", {}).get("confidence", 0) >= 60]
     if not buy_results:
         return
 
@@ -214,9 +245,11 @@ async def alert_scan_summary(market: str, results: list[dict], openclaw_verdicts
         score = s.get("score", 0)
 
         # Description: company info + verdict
-        desc = f"*{company_desc}*\n" if company_desc else ""
-        desc += f"📍 {exchange} • {sector.title()}\n\n"
-        desc += f"🟢 **ACHAT recommandé** ({conf}%) | Score {score}/5 | ${price:.2f}"
+        desc = (
+            (f"*{company_desc}*\n" if company_desc else "")
+            + f"📍 {exchange} • {sector.title()}\n\n"
+            f"🟢 **ACHAT recommandé** ({conf}%) | Score {score}/5 | ${price:.2f}"
+        )
 
         fields = []
 
@@ -229,20 +262,13 @@ async def alert_scan_summary(market: str, results: list[dict], openclaw_verdicts
             macro_s = scores_map.get("macro", {}).get("score", 0)
             sent_s = scores_map.get("sentiment", {}).get("score", 0)
 
-            def _label(s):
-                if s >= 0.5: return "très positive"
-                if s >= 0.1: return "positive"
-                if s > -0.1: return "neutre"
-                if s > -0.5: return "négative"
-                return "très négative"
-
             fields.append({
                 "name": "📊 Nos 4 analystes",
                 "value": (
-                    f"📊 Analyse technique : {_label(tech_s)} ({tech_s:+.1f})\n"
-                    f"📈 Santé financière : {_label(fund_s)} ({fund_s:+.1f})\n"
-                    f"🌍 Contexte économique : {_label(macro_s)} ({macro_s:+.1f})\n"
-                    f"💬 Opinion du marché : {_label(sent_s)} ({sent_s:+.1f})"
+                    f"📊 Analyse technique : {_score_label(tech_s)} ({tech_s:+.1f})\n"
+                    f"📈 Santé financière : {_score_label(fund_s)} ({fund_s:+.1f})\n"
+                    f"🌍 Contexte économique : {_score_label(macro_s)} ({macro_s:+.1f})\n"
+                    f"💬 Opinion du marché : {_score_label(sent_s)} ({sent_s:+.1f})"
                 ),
                 "inline": False,
             })
@@ -286,15 +312,8 @@ async def alert_scan_summary(market: str, results: list[dict], openclaw_verdicts
         if trend is not None:
             tech_lines.append(f"L'action a {'pris' if trend > 0 else 'perdu'} {abs(trend):.1f}% sur 5 jours")
         if filters:
-            filter_labels = {
-                "price_above_sma20": "Au-dessus de sa moyenne 20 jours",
-                "trend_5d_positive": "Tendance 5 jours positive",
-                "rsi_below_threshold": "Pas en zone de surachat",
-                "price_above_sma200": "Au-dessus de sa moyenne 200 jours",
-                "atr_relative_ok": "Volatilité maîtrisée",
-            }
             for k, v in filters.items():
-                label = filter_labels.get(k, k)
+                label = _FILTER_LABELS.get(k, k)
                 tech_lines.append(f"{'✅' if v else '❌'} {label}")
         if tech_lines:
             fields.append({"name": "📊 Signaux techniques", "value": "\n".join(tech_lines), "inline": False})
@@ -327,18 +346,38 @@ async def alert_scan_summary(market: str, results: list[dict], openclaw_verdicts
         })
 
     if embeds:
-        embeds[-1]["timestamp"] = datetime.utcnow().isoformat()
+        embeds[-1]["timestamp"] = timestamp
         embeds[-1]["footer"] = {"text": f"Trading Agent v2 | {market} — {len(buy_results)} achat(s) recommandé(s)"}
         await send_discord_embed(embeds)
 
 
+def _split_text(text: str, max_len: int = EMBED_DESCRIPTION_MAX) -> list[str]:
+    """Split text into <= max_len chunks on line breaks, in one forward pass over offsets."""
+    chunks = []
+    i, n = 0, len(text)
+    while i < n:
+        j = min(i + max_len, n)
+        if j < n:
+            k = text.rfind("\n", i, j)
+            if k > i:
+                j = k
+        chunks.append(text[i:j])
+        i = j
+        while i < n and text[i] == "\n":
+            i += 1
+    return chunks
+
+
 async def alert_daily_summary(summary: str) -> None:
-    """Send end-of-day summary to Discord."""
-    embed = {
-        "title": "📊 Résumé Journalier",
-        "description": summary[:4096],
-        "color": COLOR_INFO,
-        "timestamp": datetime.utcnow().isoformat(),
-        "footer": {"text": "Trading Agent | Résumé fin de journée"},
-    }
-    await send_discord_embed([embed])
+    """Send end-of-day summary to Discord (one embed per 4096-char chunk, nothing truncated)."""
+    chunks = _split_text(summary) or [""]
+    for idx, chunk in enumerate(chunks):
+        embed = {
+            "title": "📊 Résumé Journalier" if idx == 0 else f"📊 Résumé Journalier ({idx + 1}/{len(chunks)})",
+            "description": chunk,
+            "color": COLOR_INFO,
+        }
+        if idx == len(chunks) - 1:
+            embed["timestamp"] = datetime.utcnow().isoformat()
+            embed["footer"] = {"text": "Trading Agent | Résumé fin de journée"}
+        await send_discord_embed([embed])
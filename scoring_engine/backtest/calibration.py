@@ -9,6 +9,7 @@ This module stores the calibration table and provides a lookup function.
 import json
 import logging
 import os
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
@@ -31,9 +32,8 @@ def load_calibration() -> dict:
     if _calibration:
         return _calibration
     try:
-        with open(CALIBRATION_FILE) as f:
-            _calibration = json.load(f)
-            logger.info("Loaded calibration from %s", CALIBRATION_FILE)
+        _calibration = json.loads(Path(CALIBRATION_FILE).read_text(encoding="utf-8"))
+        logger.info("Loaded calibration from %s", CALIBRATION_FILE)
     except FileNotFoundError:
         _calibration = DEFAULT_CALIBRATION
         logger.info("Using default calibration (no backtest run yet)")
@@ -45,8 +45,8 @@ def save_calibration(data: dict):
     global _calibration
     _calibration = data
     try:
-        with open(CALIBRATION_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        # Serialize in memory and write once (json.dump issues one write per token)
+        Path(CALIBRATION_FILE).write_text(json.dumps(data, indent=2), encoding="utf-8")
         logger.info("Saved calibration to %s", CALIBRATION_FILE)
     except Exception as e:
         logger.error("Failed to save calibration: %s", e)
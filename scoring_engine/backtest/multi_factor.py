@@ -21,7 +21,7 @@ import asyncio
 import logging
 from collections import defaultdict
 
-from scoring_engine.backtest.replayer import _query
+from scoring_engine.backtest.replayer import _query, _score_thresholds
 
 logger = logging.getLogger(__name__)
 
@@ -36,24 +36,27 @@ async def _get_sp500_closes() -> dict[int, float]:
 
 async def _get_ticker_data(ticker: str) -> tuple[list, list]:
     """Get OHLCV + technicals for a ticker."""
-    ohlcv = await _query(
-        f"SELECT time, open, high, low, close, volume FROM ohlcv "
-        f"WHERE ticker='{ticker}' ORDER BY time ASC"
-    )
-    tech = await _query(
-        f"SELECT time, rsi_14, sma_20, sma_50, sma_200, atr_14, "
-        f"macd_histogram, bollinger_lower, bollinger_upper, stochastic_k "
-        f"FROM technicals_history WHERE ticker='{ticker}' ORDER BY time ASC"
+    ohlcv, tech = await asyncio.gather(
+        _query(
+            f"SELECT time, open, high, low, close, volume FROM ohlcv "
+            f"WHERE ticker='{ticker}' ORDER BY time ASC"
+        ),
+        _query(
+            f"SELECT time, rsi_14, sma_20, sma_50, sma_200, atr_14, "
+            f"macd_histogram, bollinger_lower, bollinger_upper, stochastic_k "
+            f"FROM technicals_history WHERE ticker='{ticker}' ORDER BY time ASC"
+        ),
     )
     return ohlcv, tech
 
 
 def _compute_factors(i: int, closes: list, volumes: list, tech_by_time: dict,
-                     sp500: dict, ts: int, close: float, params: dict) -> dict | None:
+                     sp500: dict, ts: int, close: float, thresholds: tuple[float, float, bool]) -> dict | None:
     """Compute all factors for a single day."""
     tech = tech_by_time.get(ts)
     if not tech or not close or close <= 0:
         return None
+    t5d_threshold, rsi_threshold, require_sma200 = thresholds
 
     sma_20 = tech.get("sma_20")
     sma_50 = tech.get("sma_50")
@@ -69,9 +72,9 @@ def _compute_factors(i: int, closes: list, volumes: list, tech_by_time: dict,
     trend_5d = ((close - close_5d) / close_5d * 100) if close_5d and close_5d > 0 else None
 
     f1 = bool(sma_20 and close > sma_20)
-    f2 = bool(trend_5d is not None and trend_5d > params.get("t5d_threshold", 2.5))
-    f3 = bool(rsi is not None and rsi < params.get("rsi_threshold", 55))
-    f4 = bool(sma_200 and close > sma_200) if params.get("require_sma200", True) else True
+    f2 = bool(trend_5d is not None and trend_5d > t5d_threshold)
+    f3 = bool(rsi is not None and rsi < rsi_threshold)
+    f4 = bool(sma_200 and close > sma_200) if require_sma200 else True
     atr_rel = (atr / close * 100) if atr and close > 0 else None
     f5 = bool(atr_rel is not None and atr_rel < 2.5)
     tech_score = sum([f1, f2, f3, f4, f5])
@@ -199,13 +202,14 @@ async def run_multi_factor_backtest(tickers_params: dict, horizons: list[int] =
         tech_by_time = {r["time"]: r for r in tech_list}
         closes = [(r["time"], r["close"]) for r in ohlcv if r.get("close")]
         volumes = [(r["time"], r.get("volume")) for r in ohlcv]
-        close_by_idx = {i: (t, c) for i, (t, c) in enumerate(closes)}
+        n_closes = len(closes)
+        thresholds = _score_thresholds(params)
 
         for i, (ts, close) in enumerate(closes):
             if i < 60:  # need 60 days lookback
                 continue
 
-            factors = _compute_factors(i, closes, volumes, tech_by_time, sp500, ts, close, params)
+            factors = _compute_factors(i, closes, volumes, tech_by_time, sp500, ts, close, thresholds)
             if not factors:
                 continue
 
@@ -219,11 +223,9 @@ async def run_multi_factor_backtest(tickers_params: dict, horizons: list[int] =
 
                 for h in horizons:
                     future_idx = i + h
-                    if future_idx not in close_by_idx:
-                        continue
-                    future_close = close_by_idx[future_idx][1]
-                    if not future_close:
+                    if future_idx >= n_closes:
                         continue
+                    future_close = closes[future_idx][1]
 
                     ret = (future_close - close) / close * 100
                     bucket = strategy_results[strat_name][h]
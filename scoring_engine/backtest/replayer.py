@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 
 _client = httpx.AsyncClient(timeout=60.0)
 
+# Tickers backtested concurrently by backtest_all
+BACKTEST_CONCURRENCY = 4
+
 
 async def _query(q: str) -> list[dict]:
     params = {"db": INFLUXDB_DATABASE, "q": q, "epoch": "s"}
@@ -60,8 +63,19 @@ async def get_technicals_history(ticker: str) -> list[dict]:
     return rows
 
 
-def _compute_score_from_row(row: dict, close: float, close_5d_ago: float | None, params: dict) -> dict:
+def _score_thresholds(params: dict) -> tuple[float, float, bool]:
+    """(t5d_threshold, rsi_threshold, require_sma200) — resolved once per ticker, not per bar."""
+    return (
+        params.get("t5d_threshold", 2.5),
+        params.get("rsi_threshold", 55),
+        params.get("require_sma200", True),
+    )
+
+
+def _compute_score_from_row(row: dict, close: float, close_5d_ago: float | None,
+                            thresholds: tuple[float, float, bool]) -> dict:
     """Compute 5-filter binary score from a single row of technicals."""
+    t5d_threshold, rsi_threshold, require_sma200 = thresholds
     sma_20 = row.get("sma_20")
     sma_200 = row.get("sma_200")
     rsi_14 = row.get("rsi_14")
@@ -72,13 +86,13 @@ def _compute_score_from_row(row: dict, close: float, close_5d_ago: float | None,
 
     # Filter 2: 5-day trend > threshold
     trend_5d = ((close - close_5d_ago) / close_5d_ago * 100) if close_5d_ago and close_5d_ago > 0 else None
-    f2 = bool(trend_5d is not None and trend_5d > params.get("t5d_threshold", 2.5))
+    f2 = bool(trend_5d is not None and trend_5d > t5d_threshold)
 
     # Filter 3: RSI < threshold
-    f3 = bool(rsi_14 is not None and rsi_14 < params.get("rsi_threshold", 55))
+    f3 = bool(rsi_14 is not None and rsi_14 < rsi_threshold)
 
     # Filter 4: price > SMA200 (if required)
-    if params.get("require_sma200", True):
+    if require_sma200:
         f4 = bool(sma_200 and close > sma_200)
     else:
         f4 = True
@@ -102,8 +116,10 @@ async def backtest_ticker(ticker: str, params: dict, horizons: list[int] = None)
     if horizons is None:
         horizons = [5, 10, 20, 60]
 
-    ohlcv = await get_ohlcv_history(ticker)
-    technicals = await get_technicals_history(ticker)
+    ohlcv, technicals = await asyncio.gather(
+        get_ohlcv_history(ticker),
+        get_technicals_history(ticker),
+    )
 
     if not ohlcv or not technicals:
         return {"ticker": ticker, "error": "no_data", "bars": 0}
@@ -111,10 +127,11 @@ async def backtest_ticker(ticker: str, params: dict, horizons: list[int] = None)
     # Index technicals by timestamp
     tech_by_time = {r["time"]: r for r in technicals}
 
-    # Build close price index
+    # Close price series (bars without a close are dropped, so every entry is non-null)
     closes = [(r["time"], r["close"]) for r in ohlcv if r.get("close")]
-    close_by_idx = {i: (t, c) for i, (t, c) in enumerate(closes)}
+    n_closes = len(closes)
 
+    thresholds = _score_thresholds(params)
     results_by_score = defaultdict(lambda: {h: {"total": 0, "profitable": 0, "returns": []} for h in horizons})
 
     for i, (ts, close) in enumerate(closes):
@@ -126,9 +143,9 @@ async def backtest_ticker(ticker: str, params: dict, horizons: list[int] = None)
             continue
 
         # 5-day ago close
-        close_5d_ago = close_by_idx[i - 5][1] if (i - 5) in close_by_idx else None
+        close_5d_ago = closes[i - 5][1] if i >= 5 else None
 
-        score_data = _compute_score_from_row(tech, close, close_5d_ago, params)
+        score_data = _compute_score_from_row(tech, close, close_5d_ago, thresholds)
         score = score_data["score"]
 
         if score < 3:
@@ -137,11 +154,9 @@ async def backtest_ticker(ticker: str, params: dict, horizons: list[int] = None)
         # Check future returns at each horizon
         for h in horizons:
             future_idx = i + h
-            if future_idx not in close_by_idx:
-                continue
-            future_close = close_by_idx[future_idx][1]
-            if future_close is None:
+            if future_idx >= n_closes:
                 continue
+            future_close = closes[future_idx][1]
 
             ret = (future_close - close) / close * 100
             bucket = results_by_score[score][h]
@@ -192,10 +207,18 @@ async def backtest_all(tickers_params: dict[str, dict], horizons: list[int] = No
     """
     start = time.time()
     results = {}
-    global_stats = defaultdict(lambda: defaultdict(lambda: {"total": 0, "profitable": 0, "returns": []}))
+    global_stats = defaultdict(lambda: defaultdict(lambda: {"total": 0, "profitable": 0, "return_sum": 0.0}))
+
+    # Overlap the per-ticker InfluxDB reads, bounded so the database isn't flooded
+    sem = asyncio.Semaphore(BACKTEST_CONCURRENCY)
+
+    async def _run(ticker: str, params: dict) -> dict:
+        async with sem:
+            return await backtest_ticker(ticker, params, horizons)
+
+    per_ticker = await asyncio.gather(*(_run(t, p) for t, p in tickers_params.items()))
 
-    for ticker, params in tickers_params.items():
-        r = await backtest_ticker(ticker, params, horizons)
+    for ticker, r in zip(tickers_params, per_ticker):
         results[ticker] = r
 
         # Aggregate
@@ -204,7 +227,8 @@ async def backtest_all(tickers_params: dict[str, dict], horizons: list[int] = No
                 g = global_stats[score_key][h_key]
                 g["total"] += h_data["total_signals"]
                 g["profitable"] += h_data["profitable"]
-                g["returns"].extend([h_data["avg_return"]] * h_data["total_signals"])
+                # Signal-weighted sum: same mean as expanding avg_return once per signal
+                g["return_sum"] += h_data["avg_return"] * h_data["total_signals"]
 
     # Compute global averages
     global_summary = {}
@@ -214,7 +238,7 @@ async def backtest_all(tickers_params: dict[str, dict], horizons: list[int] = No
             total = g["total"]
             if total > 0:
                 win_rate = g["profitable"] / total * 100
-                avg_ret = sum(g["returns"]) / len(g["returns"]) if g["returns"] else 0
+                avg_ret = g["return_sum"] / total
             else:
                 win_rate = avg_ret = 0
             global_summary[score_key][h_key] = {
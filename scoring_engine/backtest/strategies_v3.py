@@ -216,15 +216,14 @@ async def run_v3_backtest(tickers: list[str], horizons: list[int] = None) -> dic
             continue
 
         closes = factors["close"].values
-        indices = list(range(len(factors)))
 
         for strat_name, condition in STRATEGIES_V3.items():
             try:
-                mask = condition(factors)
+                mask = condition(factors).values
             except Exception:
                 continue
 
-            signal_indices = [i for i in indices if mask.iloc[i]]
+            signal_indices = np.where(mask)[0]
 
             for i in signal_indices:
                 entry_price = closes[i]
@@ -7,6 +7,7 @@ Improvements over V3:
 4. Walk-forward — train on 7 years, test on 3 years to detect overfitting
 """
 
+import asyncio
 import logging
 from collections import defaultdict
 
@@ -85,8 +86,7 @@ EXIT_MODES_KEYS = ["fixed_60d", "rsi_exit_80"]
 async def run_v4_backtest(tickers: list[str]) -> dict:
     """Run V4 backtest: regime filter + signal combos + smart exits + walk-forward."""
 
-    sp500 = await _get_sp500_df()
-    vix = await _get_vix_df()
+    sp500, vix = await asyncio.gather(_get_sp500_df(), _get_vix_df())
 
     # Results structure: strategy -> regime -> exit_mode -> stats
     results = {}
@@ -23,6 +23,9 @@ DISCORD_WEBHOOK_URL = os.environ.get("DISCORD_WEBHOOK_URL", "")
 # --- Alert threshold ---
 SIGNAL_SCORE_THRESHOLD = int(os.environ.get("SIGNAL_SCORE_THRESHOLD", "4"))
 
+# --- Scheduled scans ---
+SCAN_CONCURRENCY = int(os.environ.get("SCAN_CONCURRENCY", "4"))  # tickers analysed in parallel
+
 # --- Feature flags ---
 AGENT_LAYERS_ENABLED = os.environ.get("AGENT_LAYERS_ENABLED", "true").lower() == "true"
 RISK_SIZING_ENABLED = os.environ.get("RISK_SIZING_ENABLED", "true").lower() == "true"
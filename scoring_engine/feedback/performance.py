@@ -1,6 +1,7 @@
 """Weekly performance reports."""
 
 import logging
+import time
 
 from scoring_engine.feedback.tracker import compute_signal_accuracy
 from scoring_engine.influx_writer import write_points, _escape_tag
@@ -14,7 +15,6 @@ async def generate_weekly_performance() -> dict:
     accuracy = await compute_signal_accuracy()
 
     # Write to InfluxDB
-    import time
     ts = int(time.time())
     fields = [
         f"win_rate={accuracy['win_rate']}",
@@ -1,5 +1,6 @@
 """Signal accuracy tracking — compare signals with subsequent price action."""
 
+import asyncio
 import logging
 import time
 
@@ -35,13 +36,17 @@ async def _query_influx(query: str) -> list[dict]:
 
 async def get_recent_signals(limit: int = 50) -> list[dict]:
     """Get recent BUY signals from InfluxDB."""
-    query = f"SELECT * FROM signals WHERE action='BUY' ORDER BY time DESC LIMIT {limit}"
+    query = f"SELECT ticker, price FROM signals WHERE action='BUY' ORDER BY time DESC LIMIT {limit}"
     return await _query_influx(query)
 
 
+# Characters stripped from tickers before they go into InfluxQL (single translate pass)
+_UNSAFE_TICKER_CHARS = str.maketrans("", "", "';\\\"")
+
+
 def _safe_ticker(ticker: str) -> str:
     """Sanitize ticker for InfluxQL to prevent injection."""
-    return ticker.replace("'", "").replace(";", "").replace("\\", "").replace('"', "")
+    return ticker.translate(_UNSAFE_TICKER_CHARS)
 
 
 async def get_price_at_time(ticker: str, timestamp: str) -> float | None:
@@ -80,13 +85,17 @@ async def compute_signal_accuracy(lookback_days: list[int] | None = None) -> dic
     total_return = 0.0
     evaluated = 0
 
+    # One price fetch per distinct ticker, all in parallel
+    tickers = list({sig.get("ticker") for sig in signals if sig.get("ticker") and sig.get("price")})
+    prices = dict(zip(tickers, await asyncio.gather(*(get_current_price(t) for t in tickers))))
+
     for sig in signals:
         ticker = sig.get("ticker", "")
         signal_price = sig.get("price", 0)
         if not ticker or not signal_price:
             continue
 
-        current = await get_current_price(ticker)
+        current = prices.get(ticker)
         if current is None:
             continue
 
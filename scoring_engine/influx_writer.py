@@ -16,9 +16,11 @@ logger = logging.getLogger(__name__)
 
 _client = httpx.AsyncClient(timeout=10.0)
 
+_TAG_ESCAPES = str.maketrans({" ": "\\ ", ",": "\\,", "=": "\\="})
+
 
 def _escape_tag(v: str) -> str:
-    return v.replace(" ", "\\ ").replace(",", "\\,").replace("=", "\\=")
+    return v.translate(_TAG_ESCAPES)
 
 
 def _escape_field_str(v: str) -> str:
@@ -45,10 +47,9 @@ async def write_points(lines: list[str]) -> bool:
         return False
 
 
-async def write_technicals(ticker: str, market: str, data: dict) -> bool:
+def _technicals_line(ticker: str, market: str, data: dict, ts: int) -> str:
     ma = data.get("moving_averages", {})
     macd = data.get("macd", {}) or {}
-    ts = int(time.time())
     fields = []
     for k, v in [
         ("price", data.get("price")),
@@ -65,23 +66,29 @@ async def write_technicals(ticker: str, market: str, data: dict) -> bool:
             fields.append(f"{k}={v}")
     trend = ma.get("trend", "neutral")
     fields.append(f'ma_trend="{_escape_field_str(trend)}"')
-    if not fields:
-        return True
-    line = f"technicals,ticker={_escape_tag(ticker)},market={market} {','.join(fields)} {ts}"
-    return await write_points([line])
+    return f"technicals,ticker={_escape_tag(ticker)},market={market} {','.join(fields)} {ts}"
 
 
-async def write_sentiment(ticker: str, source: str, score: float, label: str) -> bool:
-    ts = int(time.time())
-    line = (
+def _sentiment_line(ticker: str, source: str, score: float, label: str, ts: int) -> str:
+    return (
         f'sentiment,ticker={_escape_tag(ticker)},source={_escape_tag(source)} '
         f'score={score},label="{_escape_field_str(label)}" {ts}'
     )
-    return await write_points([line])
 
 
-async def write_scoring(ticker: str, market: str, score_data: dict, llm: dict) -> bool:
-    ts = int(time.time())
+def _analyst_report_lines(ticker: str, reports, ts: int) -> list[str]:
+    lines = []
+    for r in reports:
+        fields = [
+            f"score={r.score}",
+            f"confidence={r.confidence}i",
+        ]
+        line = f"analyst_report,ticker={_escape_tag(ticker)},agent={_escape_tag(r.agent_name)} {','.join(fields)} {ts}"
+        lines.append(line)
+    return lines
+
+
+def _scoring_line(ticker: str, market: str, score_data: dict, llm: dict, ts: int) -> str:
     filters = score_data.get("filters", {})
     fields = [
         f"score={score_data['score']}i",
@@ -93,20 +100,27 @@ async def write_scoring(ticker: str, market: str, score_data: dict, llm: dict) -
         f'llm_verdict="{_escape_field_str(llm.get("verdict", "HOLD"))}"',
         f"llm_confidence={llm.get('confidence', 0)}i",
     ]
-    line = f"scoring,ticker={_escape_tag(ticker)},market={market} {','.join(fields)} {ts}"
-    return await write_points([line])
+    return f"scoring,ticker={_escape_tag(ticker)},market={market} {','.join(fields)} {ts}"
 
 
-async def write_signal(ticker: str, action: str, confidence: int, price: float, score: int, summary: str) -> bool:
-    ts = int(time.time())
+def _signal_line(ticker: str, action: str, confidence: int, price: float, score: int, summary: str, ts: int) -> str:
     fields = [
         f"confidence={confidence}i",
         f"price={price}",
         f"score={score}i",
         f'reason="{_escape_field_str(summary[:500])}"',
     ]
-    line = f"signals,ticker={_escape_tag(ticker)},action={_escape_tag(action)},source=auto {','.join(fields)} {ts}"
-    return await write_points([line])
+    return f"signals,ticker={_escape_tag(ticker)},action={_escape_tag(action)},source=auto {','.join(fields)} {ts}"
+
+
+async def write_buy_signals(rows: list[tuple[str, dict, dict]]) -> bool:
+    """Write signal + scoring points for all (ticker, score_data, llm) BUYs of a scan in one request."""
+    ts = int(time.time())
+    lines = []
+    for ticker, s, llm in rows:
+        lines.append(_signal_line(ticker, "BUY", llm["confidence"], s.get("price", 0), s.get("score", 0), llm["summary"], ts))
+        lines.append(_scoring_line(ticker, s.get("market", ""), s, llm, ts))
+    return await write_points(lines)
 
 
 async def write_pipeline_status(pipeline: str, duration: float, tickers: int, signals: int, errors: int) -> bool:
@@ -121,17 +135,14 @@ async def write_pipeline_status(pipeline: str, duration: float, tickers: int, si
     return await write_points([line])
 
 
-async def write_analyst_reports(ticker: str, reports) -> bool:
-    """Write analyst agent reports to InfluxDB."""
+async def write_ticker_scan(ticker: str, market: str, technicals: dict, sentiment: dict | None, reports) -> bool:
+    """Write one ticker's technicals, combined sentiment and analyst reports in a single request."""
     ts = int(time.time())
-    lines = []
-    for r in reports:
-        fields = [
-            f"score={r.score}",
-            f"confidence={r.confidence}i",
-        ]
-        line = f"analyst_report,ticker={_escape_tag(ticker)},agent={_escape_tag(r.agent_name)} {','.join(fields)} {ts}"
-        lines.append(line)
+    lines = [_technicals_line(ticker, market, technicals, ts)]
+    if sentiment and sentiment.get("unified_score") is not None:
+        lines.append(_sentiment_line(ticker, "combined", sentiment["unified_score"],
+                                     sentiment.get("unified_label", "neutral"), ts))
+    lines.extend(_analyst_report_lines(ticker, reports, ts))
     return await write_points(lines)
 
 
@@ -6,11 +6,15 @@ import os
 
 import httpx
 
+from scoring_engine.agents.base import strip_code_fence
+
 logger = logging.getLogger(__name__)
 
 OPENCLAW_API_URL = os.environ.get("OPENCLAW_API_URL", "http://192.168.1.125:18789/v1/responses")
 OPENCLAW_TOKEN = os.environ.get("OPENCLAW_GATEWAY_TOKEN", "")
 
+_client = httpx.AsyncClient(timeout=180.0)
+
 DECISION_PROMPT = """Tu es le comite d'investissement d'un fonds. Tu recois les rapports de 4-5 analystes (technique, fondamental, macro, sentiment, et parfois GROK_X qui analyse le sentiment temps reel sur X/Twitter) pour chaque ticker.
 
 IMPORTANT sur GROK_X : quand present, ce rapport confronte notre analyse avec le sentiment reel des traders sur X. Si GROK_X indique "DIVERGENCE: contredit" avec "contrarian_signal: OUI", c'est un signal fort — les traders sur X voient quelque chose que nos indicateurs ne captent pas. Pese cette information dans ta decision.
@@ -55,16 +59,16 @@ SELL = eviter/sortir.
 IMPORTANT pour les WATCH : ne les mets PAS dans le classement principal. Mentionne-les dans market_comment en disant : "X tickers a surveiller (noms) — signal mean reversion en attente de confirmation". Quand un ancien WATCH passe en BUY, signale-le dans portfolio_alerts avec "NOUVEAU : [ticker] passe de A SURVEILLER a ACHAT"."""
 
 
-async def get_openclaw_verdicts(ticker_reports: list[dict]) -> dict | None:
-    """Send all ticker reports to OpenClaw and get portfolio-level verdicts."""
-    if not OPENCLAW_TOKEN:
-        logger.warning("OPENCLAW_GATEWAY_TOKEN not set, skipping decision")
-        return None
+# Calibration prompt block, rebuilt only when load_calibration() returns a new table
+_cal_block_src: dict | None = None
+_cal_block: list[str] = []
 
-    # Format reports into a structured prompt
-    # Include calibration data so Claude uses real win rates
-    from scoring_engine.backtest.calibration import load_calibration
-    cal = load_calibration()
+
+def _calibration_block(cal: dict) -> list[str]:
+    """Format calibration win rates for the prompt (cached per calibration object)."""
+    global _cal_block_src, _cal_block
+    if cal is _cal_block_src:
+        return _cal_block
     lines = ["\n=== DONNEES DE CALIBRATION (basees sur 10 ans de backtest) ==="]
     for score_key in sorted(cal.keys()):
         parts = []
@@ -74,6 +78,20 @@ async def get_openclaw_verdicts(ticker_reports: list[dict]) -> dict | None:
         if parts:
             lines.append(f"  {score_key}: {' | '.join(parts)}")
     lines.append("UTILISE ces win rates comme base de conviction — ne les invente pas.\n")
+    _cal_block_src, _cal_block = cal, lines
+    return lines
+
+
+async def get_openclaw_verdicts(ticker_reports: list[dict]) -> dict | None:
+    """Send all ticker reports to OpenClaw and get portfolio-level verdicts."""
+    if not OPENCLAW_TOKEN:
+        logger.warning("OPENCLAW_GATEWAY_TOKEN not set, skipping decision")
+        return None
+
+    # Format reports into a structured prompt
+    # Include calibration data so Claude uses real win rates
+    from scoring_engine.backtest.calibration import load_calibration
+    lines = list(_calibration_block(load_calibration()))
 
     for tr in ticker_reports:
         ticker = tr.get("ticker", "?")
@@ -147,39 +165,31 @@ async def get_openclaw_verdicts(ticker_reports: list[dict]) -> dict | None:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=180.0) as client:
-            resp = await client.post(OPENCLAW_API_URL, json=payload, headers=headers)
-
-            if resp.status_code != 200:
-                logger.error("OpenClaw decision error %d: %s", resp.status_code, resp.text[:300])
-                return None
-
-            data = resp.json()
-
-            # Extract text from OpenClaw response
-            output_text = ""
-            output = data.get("output", [])
-            if isinstance(output, list):
-                for item in output:
-                    if isinstance(item, dict) and item.get("type") == "message":
-                        for content in item.get("content", []):
-                            if isinstance(content, dict) and content.get("type") == "output_text":
-                                output_text = content.get("text", "")
-                                break
-            elif isinstance(output, str):
-                output_text = output
-            if not output_text:
-                output_text = data.get("text", "") or data.get("content", "")
-
-            # Parse JSON
-            text = output_text.strip()
-            if text.startswith("```"):
-                text = text.split("\n", 1)[-1]
-                if text.endswith("```"):
-                    text = text[:-3]
-                text = text.strip()
-
-            return json.loads(text)
+        resp = await _client.post(OPENCLAW_API_URL, json=payload, headers=headers)
+
+        if resp.status_code != 200:
+            logger.error("OpenClaw decision error %d: %s", resp.status_code, resp.text[:300])
+            return None
+
+        data = resp.json()
+
+        # Extract text from OpenClaw response
+        output_text = ""
+        output = data.get("output", [])
+        if isinstance(output, list):
+            for item in output:
+                if isinstance(item, dict) and item.get("type") == "message":
+                    for content in item.get("content", []):
+                        if isinstance(content, dict) and content.get("type") == "output_text":
+                            output_text = content.get("text", "")
+                            break
+        elif isinstance(output, str):
+            output_text = output
+        if not output_text:
+            output_text = data.get("text", "") or data.get("content", "")
+
+        # Parse JSON
+        return json.loads(strip_code_fence(output_text))
 
     except json.JSONDecodeError as e:
         logger.warning("OpenClaw returned non-JSON: %s | raw: %s", e, output_text[:300])
@@ -13,15 +13,13 @@ from scoring_engine.config import (
     SIGNAL_SCORE_THRESHOLD,
     AGENT_LAYERS_ENABLED,
     RISK_SIZING_ENABLED,
+    SCAN_CONCURRENCY,
 )
 from scoring_engine.scorer import compute_score
 from scoring_engine.influx_writer import (
-    write_technicals,
-    write_sentiment,
-    write_scoring,
-    write_signal,
+    write_buy_signals,
     write_pipeline_status,
-    write_analyst_reports,
+    write_ticker_scan,
 )
 from scoring_engine.alerter import alert_signal, alert_scan_summary, alert_daily_summary
 
@@ -29,6 +27,18 @@ logger = logging.getLogger(__name__)
 
 _client = httpx.AsyncClient(timeout=30.0)
 
+_EU_SUFFIXES = (".PA", ".DE", ".AS", ".SW", ".L")
+
+# Fire-and-forget diagnostics (keep a reference so tasks aren't GC'd mid-flight)
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _spawn(coro) -> None:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
 # Lazy-init agents
 _agents_initialized = False
 _init_lock = asyncio.Lock()
@@ -89,7 +99,16 @@ async def _fetch_macro_overview() -> dict:
         _fetch(f"{MARKET_DATA_URL}/stock/market-overview", "macro"),
         _fetch(f"{MARKET_DATA_URL}/stock/sector-performance", "sectors"),
     )
-    return {"macro": macro or {}, "sectors": sectors or {}}
+    from scoring_engine.agents.macro import extract_market_indicators
+    macro = macro or {}
+    # VIX and macro indicators extracted once per scan, shared by every ticker
+    indicators = extract_market_indicators(macro)
+    return {
+        "macro": macro,
+        "sectors": sectors or {},
+        "vix": indicators["vix"],
+        "indicators": indicators,
+    }
 
 
 # --- Core pipeline ---
@@ -100,8 +119,8 @@ async def scan_ticker(ticker: str, macro_context: dict | None = None) -> dict:
 
     # Fetch all data in parallel
     await _init_agents()
-    if not macro_context:
-        macro_context = await _fetch_macro_overview()
+    # Standalone scans fetch macro alongside the ticker data instead of before it
+    macro_task = None if macro_context else asyncio.create_task(_fetch_macro_overview())
     technicals, sentiment, fundamentals, analyst_data, insider_data, options_data = await asyncio.gather(
         _fetch(f"{MARKET_DATA_URL}/stock/technicals/{ticker}", f"technicals/{ticker}"),
         _fetch(f"{SENTIMENT_URL}/sentiment/combined/{ticker}", f"sentiment/{ticker}"),
@@ -110,20 +129,18 @@ async def scan_ticker(ticker: str, macro_context: dict | None = None) -> dict:
         _fetch(f"{SENTIMENT_URL}/sentiment/insider/{ticker}", f"insider/{ticker}"),
         _fetch(f"{SENTIMENT_URL}/sentiment/options/{ticker}", f"options/{ticker}"),
     )
+    if macro_task is not None:
+        macro_context = await macro_task
 
     if not technicals:
         result["error"] = "technicals_unavailable"
         return result
 
-    # Extract VIX from macro context for regime-adjusted scoring
-    vix = None
-    if macro_context:
-        macro_markets = (macro_context.get("macro") or {}).get("markets", [])
-        if isinstance(macro_markets, list):
-            for item in macro_markets:
-                if "vix" in (item.get("name", "")).lower() or item.get("symbol") == "^VIX":
-                    vix = item.get("price")
-                    break
+    # VIX from macro context for regime-adjusted scoring
+    vix = macro_context.get("vix")
+    if vix is None and "vix" not in macro_context:
+        from scoring_engine.agents.macro import extract_market_indicators
+        vix = extract_market_indicators(macro_context.get("macro") or {})["vix"]
 
     # V4 score with regime-adjusted win rates + insider + options
     score_data = compute_score(ticker, technicals, vix=vix,
@@ -141,7 +158,7 @@ async def scan_ticker(ticker: str, macro_context: dict | None = None) -> dict:
     # Grok X contextual — only if high fear + US ticker
     grok_report = None
     fg_raw = ((sentiment or {}).get("macro_sentiment") or {}).get("fear_greed_raw", 50)
-    is_us = not any(ticker.endswith(s) for s in (".PA", ".DE", ".AS", ".SW", ".L"))
+    is_us = not ticker.endswith(_EU_SUFFIXES)
     if fg_raw is not None and fg_raw < 30 and is_us:
         fund_metrics = (fundamentals or {})
         briefing = {
@@ -172,10 +189,7 @@ async def scan_ticker(ticker: str, macro_context: dict | None = None) -> dict:
     result["llm"] = {"verdict": "HOLD", "confidence": 0, "summary": "En attente de décision OpenClaw"}
 
     # Write to InfluxDB
-    await write_technicals(ticker, score_data["market"], technicals)
-    if sentiment and sentiment.get("unified_score") is not None:
-        await write_sentiment(ticker, "combined", sentiment["unified_score"], sentiment.get("unified_label", "neutral"))
-    await write_analyst_reports(ticker, reports)
+    await write_ticker_scan(ticker, score_data["market"], technicals, sentiment, reports)
 
     return result
 
@@ -183,8 +197,6 @@ async def scan_ticker(ticker: str, macro_context: dict | None = None) -> dict:
 async def scan_tickers(tickers: list[str]) -> dict:
     """Scan all tickers then send to OpenClaw for portfolio-level decisions."""
     start = time.time()
-    results = []
-    errors = 0
     signals = 0
 
     # Shared macro context (1 fetch for all tickers)
@@ -195,16 +207,23 @@ async def scan_tickers(tickers: list[str]) -> dict:
         from scoring_engine.risk.portfolio_risk import reset_cycle
         await reset_cycle()
 
-    # Scan all tickers (Ollama factual reports)
-    for ticker in tickers:
-        r = await scan_ticker(ticker, macro_context=macro_context)
-        results.append(r)
-        if r.get("error"):
-            errors += 1
+    # Scan all tickers (Ollama factual reports), bounded so Ollama/market data aren't stampeded
+    sem = asyncio.Semaphore(SCAN_CONCURRENCY)
+
+    async def _scan_one(ticker: str) -> dict:
+        async with sem:
+            try:
+                return await scan_ticker(ticker, macro_context=macro_context)
+            except Exception as e:
+                logger.error("Scan failed for %s: %s", ticker, e)
+                return {"ticker": ticker, "error": str(e)}
+
+    results = list(await asyncio.gather(*(_scan_one(t) for t in tickers)))
+    valid_results = [r for r in results if not r.get("error")]
+    errors = len(results) - len(valid_results)
 
     # --- OpenClaw (Claude) decides for ALL tickers at once ---
     openclaw_verdicts = None
-    valid_results = [r for r in results if not r.get("error")]
     if valid_results:
         from scoring_engine.openclaw_decision import get_openclaw_verdicts
         openclaw_verdicts = await get_openclaw_verdicts(valid_results)
@@ -227,6 +246,7 @@ async def scan_tickers(tickers: list[str]) -> dict:
                     r["openclaw_horizon"] = v.get("horizon", "")
 
     # Risk gate + signal detection
+    buy_rows = []
     for r in results:
         s = r.get("score", {})
         llm_data = r.get("llm", {})
@@ -241,11 +261,14 @@ async def scan_tickers(tickers: list[str]) -> dict:
             if llm_data.get("verdict") == "BUY":
                 signals += 1
                 r["signal_sent"] = True
-                await write_signal(r["ticker"], "BUY", llm_data["confidence"], s.get("price", 0), s.get("score", 0), llm_data["summary"])
-                await write_scoring(r["ticker"], s.get("market", ""), s, llm_data)
+                buy_rows.append((r["ticker"], s, llm_data))
+
+    if buy_rows:
+        await write_buy_signals(buy_rows)
 
     duration = time.time() - start
-    await write_pipeline_status("scoring_v2", duration, len(tickers), signals, errors)
+    # Monitoring only — don't hold the scan result (and Discord delivery) on it
+    _spawn(write_pipeline_status("scoring_v2", duration, len(tickers), signals, errors))
 
     return {
         "tickers_scanned": len(tickers),
@@ -15,31 +15,39 @@ logger = logging.getLogger(__name__)
 # Thread-safe cycle state
 _lock = asyncio.Lock()
 _active_buy_signals: list[str] = []
+# Same BUYs indexed by sector, so checks don't rescan the whole cycle
+_buys_by_sector: dict[str, list[str]] = {}
 
 
 async def reset_cycle():
     """Reset per-cycle state. Called at start of scan_tickers."""
     async with _lock:
         _active_buy_signals.clear()
+        _buys_by_sector.clear()
 
 
 async def register_buy(ticker: str):
     """Register a BUY signal in the current scan cycle."""
     async with _lock:
         _active_buy_signals.append(ticker)
+        sector = TICKER_SECTORS.get(ticker)
+        if sector is not None:
+            _buys_by_sector.setdefault(sector, []).append(ticker)
 
 
 async def check_sector_concentration(ticker: str) -> dict:
     """Check if adding this ticker would exceed sector limits."""
     async with _lock:
         sector = TICKER_SECTORS.get(ticker, "unknown")
-        same_sector_buys = [t for t in _active_buy_signals if TICKER_SECTORS.get(t) == sector]
+        same_sector_buys = _buys_by_sector.get(sector, ())
         count = len(same_sector_buys)
+        # Only the rejection message needs the ticker names (snapshot them under the lock)
+        blocking = ", ".join(same_sector_buys) if count >= 3 else None
 
-    if count >= 3:
+    if blocking is not None:
         return {
             "passed": False,
-            "reason": f"Sector '{sector}' deja {count} signaux BUY ({', '.join(same_sector_buys)})",
+            "reason": f"Sector '{sector}' deja {count} signaux BUY ({blocking})",
             "sector": sector,
             "count": count,
         }
@@ -51,7 +59,7 @@ async def check_correlation_risk(ticker: str) -> dict:
     """Warn if multiple correlated tickers are signaling BUY simultaneously."""
     async with _lock:
         sector = TICKER_SECTORS.get(ticker, "unknown")
-        correlated = [t for t in _active_buy_signals if TICKER_SECTORS.get(t) == sector and t != ticker]
+        correlated = [t for t in _buys_by_sector.get(sector, ()) if t != ticker]
 
     if correlated:
         return {
@@ -1,6 +1,8 @@
 """FastAPI server with APScheduler for the scoring engine."""
 
+import asyncio
 import logging
+from collections import Counter
 from contextlib import asynccontextmanager
 from datetime import datetime
 
@@ -22,7 +24,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-scheduler = AsyncIOScheduler(timezone="Europe/Paris")
+# No overlapping runs of the same job; a late/missed tick runs once (within 5 min) instead of stacking
+scheduler = AsyncIOScheduler(
+    timezone="Europe/Paris",
+    job_defaults={"max_instances": 1, "coalesce": True, "misfire_grace_time": 300},
+)
 
 
 # --- Scheduled jobs ---
@@ -30,13 +36,23 @@ scheduler = AsyncIOScheduler(timezone="Europe/Paris")
 # Store pre-computed results for delivery at exact time
 _pending_results: dict[str, dict] = {}
 
+# One scheduled scan at a time: overlapping ticks queue instead of piling up
+# on the loop and hammering Ollama/market data concurrently.
+_SCAN_SEM = asyncio.Semaphore(1)
+
+
+async def _run_scan(exchange: str, send_discord: bool = True) -> dict:
+    """Run a scheduled exchange scan under the scan semaphore."""
+    from scoring_engine.pipeline import scan_exchange
+    async with _SCAN_SEM:
+        return await scan_exchange(exchange, send_discord=send_discord)
+
 
 async def _prescan_exchanges(exchanges: list[str], delivery_label: str):
     """Scan exchanges in background BEFORE market open, store results."""
-    from scoring_engine.pipeline import scan_exchange
     for exchange in exchanges:
         logger.info("Pre-scanning %s for %s delivery", exchange, delivery_label)
-        result = await scan_exchange(exchange, send_discord=False)
+        result = await _run_scan(exchange, send_discord=False)
         _pending_results[f"{delivery_label}:{exchange}"] = result
 
 
@@ -55,9 +71,8 @@ async def _deliver_results(exchanges: list[str], delivery_label: str):
 
 async def _scan_and_send(exchange: str):
     """Scan + send immediately (for rescans during the day)."""
-    from scoring_engine.pipeline import scan_exchange
     logger.info("Scheduled: %s scan", exchange)
-    await scan_exchange(exchange)
+    await _run_scan(exchange)
 
 
 async def job_daily_summary():
@@ -186,11 +201,8 @@ async def get_portfolio_risk() -> dict:
     """État du risque: signaux d'achat actifs et exposition sectorielle."""
     from scoring_engine.risk.portfolio_risk import get_active_signals, TICKER_SECTORS
     active = get_active_signals()
-    sectors = {}
-    for t in active:
-        s = TICKER_SECTORS.get(t, "unknown")
-        sectors[s] = sectors.get(s, 0) + 1
-    return {"active_buy_signals": active, "sector_exposure": sectors}
+    sectors = Counter(TICKER_SECTORS.get(t, "unknown") for t in active)
+    return {"active_buy_signals": active, "sector_exposure": dict(sectors)}
 
 
 @mcp.tool()
@@ -200,12 +212,19 @@ async def get_calibration_data() -> dict:
     return load_calibration()
 
 
+# Watchlist metadata is static config: built on first call, then reused
+_watchlist_info: dict | None = None
+
+
 @mcp.tool()
 async def get_watchlist_info() -> dict:
     """Liste des 78 tickers surveillés avec nom, pays, bourse, secteur."""
-    from scoring_engine.config import TICKERS
-    return {t: {"name": d["name"], "country": d["country"], "exchange": d["exchange"],
-                "sector": d["sector"], "desc": d["desc"]} for t, d in TICKERS.items()}
+    global _watchlist_info
+    if _watchlist_info is None:
+        from scoring_engine.config import TICKERS
+        _watchlist_info = {t: {"name": d["name"], "country": d["country"], "exchange": d["exchange"],
+                               "sector": d["sector"], "desc": d["desc"]} for t, d in TICKERS.items()}
+    return _watchlist_info
 
 
 _mcp_app = mcp.streamable_http_app()
@@ -319,11 +338,8 @@ async def api_portfolio_risk():
     """Get current risk state."""
     from scoring_engine.risk.portfolio_risk import get_active_signals, TICKER_SECTORS
     active = get_active_signals()
-    sectors = {}
-    for t in active:
-        s = TICKER_SECTORS.get(t, "unknown")
-        sectors[s] = sectors.get(s, 0) + 1
-    return {"active_buy_signals": active, "sector_exposure": sectors}
+    sectors = Counter(TICKER_SECTORS.get(t, "unknown") for t in active)
+    return {"active_buy_signals": active, "sector_exposure": dict(sectors)}
 
 
 # --- Backtesting endpoints ---